@@ -13,8 +13,9 @@ Example:
 """
 
 import argparse
-import json
-from collections import Counter
+from pathlib import Path
+
+from json_output import save_json
 
 
 def rgb_to_hex(rgb):
@@ -22,19 +23,51 @@ def rgb_to_hex(rgb):
     return '#{:02x}{:02x}{:02x}'.format(int(rgb[0]), int(rgb[1]), int(rgb[2]))
 
 
+def rgbs_to_hex(rgbs):
+    """Convert a sequence of RGB tuples to hex colors in one pass"""
+    import numpy as np
+
+    packed = np.asarray(rgbs, dtype=np.uint8).tobytes().hex()
+    return ['#' + packed[i:i + 6] for i in range(0, len(packed), 6)]
+
+
+def luminance_batch(rgbs):
+    """Calculate relative luminance for WCAG contrast of an (N, 3) RGB array"""
+    import numpy as np
+
+    c = np.asarray(rgbs, dtype=np.float64).reshape(-1, 3) / 255.0
+    lin = np.where(c <= 0.03928, c / 12.92, ((c + 0.055) / 1.055) ** 2.4)
+    return lin @ np.array([0.2126, 0.7152, 0.0722])
+
+
 def get_luminance(rgb):
     """Calculate relative luminance for WCAG contrast"""
-    r, g, b = [x / 255.0 for x in rgb]
-    r = r / 12.92 if r <= 0.03928 else ((r + 0.055) / 1.055) ** 2.4
-    g = g / 12.92 if g <= 0.03928 else ((g + 0.055) / 1.055) ** 2.4
-    b = b / 12.92 if b <= 0.03928 else ((b + 0.055) / 1.055) ** 2.4
-    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+    return float(luminance_batch(rgb)[0])
+
 
+# Below this many (non-background) pixels, median cut beats importing sklearn
+SMALL_IMAGE_PIXELS = 2000
 
-def is_grayscale(rgb, threshold=10):
-    """Check if color is grayscale"""
-    r, g, b = rgb
-    return abs(r - g) < threshold and abs(g - b) < threshold and abs(r - b) < threshold
+# Palette quality saturates well below the ~160k pixels of a 400x400 thumbnail
+MAX_SAMPLE_PIXELS = 10000
+
+
+def _print_missing_libraries():
+    print("Error: Required libraries not installed. Install with:")
+    print("  pip install Pillow numpy scikit-learn")
+
+
+def quantize_palette(pixels, num_colors):
+    """Extract color palette from an (N, 3) uint8 array with PIL's median cut"""
+    from PIL import Image
+
+    strip = Image.fromarray(pixels.reshape(1, -1, 3))
+    quantized = strip.quantize(colors=num_colors, method=Image.Quantize.MEDIANCUT)
+    palette = quantized.getpalette()
+
+    # getcolors() yields (count, index) pairs; most frequent first
+    used = sorted(quantized.getcolors(), key=lambda c: -c[0])
+    return [tuple(palette[i * 3:i * 3 + 3]) for _, i in used]
 
 
 def extract_palette(image_path, num_colors=8):
@@ -42,105 +75,133 @@ def extract_palette(image_path, num_colors=8):
     try:
         from PIL import Image
         import numpy as np
-        from sklearn.cluster import KMeans
     except ImportError:
-        print("Error: Required libraries not installed. Install with:")
-        print("  pip install Pillow numpy scikit-learn")
+        _print_missing_libraries()
         return None
 
     # Load and resize image for faster processing
     img = Image.open(image_path)
     img = img.convert('RGB')
-    img.thumbnail((400, 400))
+    if img.width > 400 or img.height > 400:
+        # Box filter is cheaper than the default bicubic and averages colors
+        img.thumbnail((400, 400), Image.Resampling.BOX)
 
-    # Convert to numpy array
-    pixels = np.array(img)
+    # Convert to numpy array (asarray avoids copying the image buffer)
+    pixels = np.asarray(img)
     pixels = pixels.reshape(-1, 3)
 
-    # Remove pure white and pure black (common background colors)
-    pixels = pixels[~np.all(pixels == [255, 255, 255], axis=1)]
-    pixels = pixels[~np.all(pixels == [0, 0, 0], axis=1)]
+    # Remove pure white and pure black (common background colors) in one pass
+    r, g, b = pixels[:, 0], pixels[:, 1], pixels[:, 2]
+    keep = ~(((r == 255) & (g == 255) & (b == 255)) | ((r == 0) & (g == 0) & (b == 0)))
+    pixels = pixels[keep]
+
+    if len(pixels) == 0:
+        return []
+    if len(pixels) < SMALL_IMAGE_PIXELS:
+        return quantize_palette(pixels, num_colors)
 
-    # Use k-means to find dominant colors
-    kmeans = KMeans(n_clusters=num_colors, random_state=42, n_init=10)
-    kmeans.fit(pixels)
+    try:
+        from sklearn.cluster import KMeans
+    except ImportError:
+        _print_missing_libraries()
+        return None
 
-    # Get cluster centers (dominant colors)
-    colors = kmeans.cluster_centers_
+    # Cluster a fixed random sample; relative color frequencies stay unbiased
+    if len(pixels) > MAX_SAMPLE_PIXELS:
+        rng = np.random.default_rng(42)
+        pixels = pixels[rng.choice(len(pixels), size=MAX_SAMPLE_PIXELS, replace=False)]
 
-    # Get cluster sizes to weight colors by frequency
-    labels = kmeans.labels_
-    label_counts = Counter(labels)
+    # Bucket pixels into a 4-bits-per-channel histogram (4096 bins) so k-means
+    # only sees the distinct colors, weighted by how often they occur
+    q = pixels >> 4
+    keys = (q[:, 0].astype(np.uint32) << 8) | (q[:, 1].astype(np.uint32) << 4) | q[:, 2]
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    inverse = inverse.ravel()
+    sums = np.stack([np.bincount(inverse, weights=pixels[:, c]) for c in range(3)], axis=1)
+    bins = sums / counts[:, None]
 
-    # Sort colors by frequency
-    color_freq = [(colors[i], label_counts[i]) for i in range(num_colors)]
-    color_freq.sort(key=lambda x: x[1], reverse=True)
+    # An image can have fewer distinct bins than requested colors
+    num_colors = min(num_colors, len(bins))
 
-    return [tuple(map(int, color)) for color, _ in color_freq]
+    # Use k-means to find dominant colors. With at most 4096 weighted bins a
+    # single k-means++ seeding matches many restarts for low-K 3D data, and
+    # plain Lloyd beats Elkan's bound bookkeeping at this K and D
+    kmeans = KMeans(n_clusters=num_colors, init='k-means++', n_init=1,
+                    max_iter=50, tol=1e-3, algorithm='lloyd', random_state=42)
+    kmeans.fit(bins, sample_weight=counts)
 
+    # Get cluster sizes (in pixels) to weight colors by frequency
+    label_counts = np.bincount(kmeans.labels_, weights=counts, minlength=num_colors)
 
-def categorize_colors(colors):
+    # Sort cluster centers (dominant colors) by frequency
+    order = np.argsort(-label_counts, kind='stable')
+    colors = kmeans.cluster_centers_[order].astype(int)
+
+    return [tuple(color) for color in colors.tolist()]
+
+
+def categorize_colors(colors, gray_threshold=10):
     """Categorize colors into primary, neutral, and accent groups"""
-    categorized = {
-        'primary': [],
-        'neutral': [],
-        'accent': []
-    }
+    import numpy as np
 
-    for rgb in colors:
-        if is_grayscale(rgb):
-            categorized['neutral'].append(rgb)
-        else:
-            # Determine if it's saturated enough to be primary/accent
-            r, g, b = rgb
-            max_val = max(r, g, b)
-            min_val = min(r, g, b)
-            saturation = (max_val - min_val) / max_val if max_val > 0 else 0
+    arr = np.asarray(colors, dtype=np.int32).reshape(-1, 3)
+    r, g, b = arr[:, 0], arr[:, 1], arr[:, 2]
 
-            if saturation > 0.3:
-                if len(categorized['primary']) < 2:
-                    categorized['primary'].append(rgb)
-                else:
-                    categorized['accent'].append(rgb)
-            else:
-                categorized['neutral'].append(rgb)
+    # Grayscale when all channels are within the threshold of each other
+    gray = ((np.abs(r - g) < gray_threshold) & (np.abs(g - b) < gray_threshold)
+            & (np.abs(r - b) < gray_threshold))
 
-    return categorized
+    # Saturated enough to be primary/accent
+    max_val = arr.max(axis=1)
+    min_val = arr.min(axis=1)
+    saturation = np.divide(max_val - min_val, max_val,
+                           out=np.zeros(len(arr)), where=max_val > 0)
+    saturated = np.flatnonzero(~gray & (saturation > 0.3))
+
+    def pick(idx):
+        return [tuple(rgb) for rgb in arr[idx].tolist()]
+
+    return {
+        'primary': pick(saturated[:2]),
+        'neutral': pick(np.flatnonzero(gray | (saturation <= 0.3))),
+        'accent': pick(saturated[2:])
+    }
+
+
+def lightness_name(luminance):
+    """Name a neutral color based on its lightness"""
+    if luminance > 0.7:
+        return "light"
+    if luminance < 0.3:
+        return "dark"
+    return "neutral"
 
 
 def generate_css_variables(categorized_colors):
     """Generate CSS custom properties from categorized colors"""
-    css_vars = []
-    css_vars.append("/* Color Palette - Generated from screenshot */")
-    css_vars.append(":root {")
-
     # Primary colors
-    for i, rgb in enumerate(categorized_colors['primary'], 1):
-        hex_color = rgb_to_hex(rgb)
-        css_vars.append(f"  --color-primary-{i}: {hex_color};")
+    primary = "".join(
+        f"  --color-primary-{i}: {hex_color};\n"
+        for i, hex_color in enumerate(rgbs_to_hex(categorized_colors['primary']), 1))
 
     # Neutral colors (sorted by luminance)
-    neutrals = sorted(categorized_colors['neutral'], key=get_luminance)
-    for i, rgb in enumerate(neutrals, 1):
-        hex_color = rgb_to_hex(rgb)
-        luminance = get_luminance(rgb)
-        # Name based on lightness
-        if luminance > 0.7:
-            name = f"light-{i}"
-        elif luminance < 0.3:
-            name = f"dark-{i}"
-        else:
-            name = f"neutral-{i}"
-        css_vars.append(f"  --color-{name}: {hex_color};")
+    neutrals = categorized_colors['neutral']
+    neutral_hex = rgbs_to_hex(neutrals)
+    lums = luminance_batch(neutrals) if neutrals else []
+    order = lums.argsort(kind='stable') if neutrals else []
+    neutral = "".join(
+        f"  --color-{lightness_name(lums[idx])}-{i}: {neutral_hex[idx]};\n"
+        for i, idx in enumerate(order, 1))
 
     # Accent colors
-    for i, rgb in enumerate(categorized_colors['accent'], 1):
-        hex_color = rgb_to_hex(rgb)
-        css_vars.append(f"  --color-accent-{i}: {hex_color};")
+    accent = "".join(
+        f"  --color-accent-{i}: {hex_color};\n"
+        for i, hex_color in enumerate(rgbs_to_hex(categorized_colors['accent']), 1))
 
-    css_vars.append("}\n")
-
-    return "\n".join(css_vars)
+    return f"""/* Color Palette - Generated from screenshot */
+:root {{
+{primary}{neutral}{accent}}}
+"""
 
 
 def generate_usage_example(categorized_colors):
@@ -148,11 +209,12 @@ def generate_usage_example(categorized_colors):
     examples = []
     examples.append("/* Usage Examples */")
     examples.append("body {")
-    if categorized_colors['neutral']:
-        bg_color = rgb_to_hex(max(categorized_colors['neutral'], key=get_luminance))
+    neutrals = categorized_colors['neutral']
+    if neutrals:
+        lums = luminance_batch(neutrals)
+        bg_color = rgb_to_hex(neutrals[lums.argmax()])
         examples.append(f"  background-color: var(--color-light-1, {bg_color});")
-    if categorized_colors['neutral']:
-        text_color = rgb_to_hex(min(categorized_colors['neutral'], key=get_luminance))
+        text_color = rgb_to_hex(neutrals[lums.argmin()])
         examples.append(f"  color: var(--color-dark-1, {text_color});")
     examples.append("}\n")
 
@@ -202,22 +264,20 @@ def main():
     css_output += "\n" + generate_usage_example(categorized)
 
     # Save CSS file
-    with open(args.output, 'w') as f:
-        f.write(css_output)
+    Path(args.output).write_text(css_output, encoding='utf-8')
 
     print(f"\n✅ CSS variables saved to {args.output}")
 
     # Optionally save JSON
     if args.json:
         json_output = {
-            'primary': [rgb_to_hex(c) for c in categorized['primary']],
-            'neutral': [rgb_to_hex(c) for c in categorized['neutral']],
-            'accent': [rgb_to_hex(c) for c in categorized['accent']],
-            'all_colors': [rgb_to_hex(c) for c in colors]
+            'primary': rgbs_to_hex(categorized['primary']),
+            'neutral': rgbs_to_hex(categorized['neutral']),
+            'accent': rgbs_to_hex(categorized['accent']),
+            'all_colors': rgbs_to_hex(colors)
         }
         json_file = args.output.replace('.css', '.json')
-        with open(json_file, 'w') as f:
-            json.dump(json_output, f, indent=2)
+        save_json(json_output, json_file)
         print(f"✅ Color data saved to {json_file}")
 
     # Print color preview
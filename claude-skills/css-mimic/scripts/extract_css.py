@@ -17,11 +17,16 @@ Example:
 """
 
 import argparse
-import json
 import re
 from collections import defaultdict
+from functools import lru_cache
 from urllib.parse import urlparse
 
+from json_output import save_json
+
+# Matches plain pixel lengths such as "16px" or "-0.5px"
+_PX_RE = re.compile(r'^(-?\d+(?:\.\d+)?)px$')
+
 
 def extract_design_tokens(page):
     """Extract design tokens from a Playwright page object"""
@@ -29,82 +34,81 @@ def extract_design_tokens(page):
     # Execute JavaScript to analyze computed styles
     tokens = page.evaluate("""
         () => {
-            const tokens = {
-                colors: new Set(),
-                fonts: new Set(),
-                fontSizes: new Set(),
-                fontWeights: new Set(),
-                spacing: new Set(),
-                borderRadius: new Set(),
-                shadows: new Set(),
-                cssVariables: {}
-            };
+            // One flat array per property; values are deduplicated once at the
+            // end instead of paying a Set.add per property per element
+            const colors = [];
+            const fonts = [];
+            const fontSizes = [];
+            const fontWeights = [];
+            const spacing = [];
+            const borderRadius = [];
+            const shadows = [];
+            const cssVariables = {};
 
             // Get all elements
             const elements = document.querySelectorAll('*');
 
-            elements.forEach(el => {
+            for (const el of elements) {
                 const styles = window.getComputedStyle(el);
 
                 // Colors
-                tokens.colors.add(styles.color);
-                tokens.colors.add(styles.backgroundColor);
-                tokens.colors.add(styles.borderColor);
+                colors.push(styles.color, styles.backgroundColor, styles.borderColor);
 
                 // Typography
-                tokens.fonts.add(styles.fontFamily);
-                tokens.fontSizes.add(styles.fontSize);
-                tokens.fontWeights.add(styles.fontWeight);
+                fonts.push(styles.fontFamily);
+                fontSizes.push(styles.fontSize);
+                fontWeights.push(styles.fontWeight);
 
                 // Spacing
-                tokens.spacing.add(styles.margin);
-                tokens.spacing.add(styles.padding);
-                tokens.spacing.add(styles.gap);
+                spacing.push(styles.margin, styles.padding, styles.gap);
 
                 // Border radius
                 if (styles.borderRadius !== '0px') {
-                    tokens.borderRadius.add(styles.borderRadius);
+                    borderRadius.push(styles.borderRadius);
                 }
 
                 // Shadows
                 if (styles.boxShadow !== 'none') {
-                    tokens.shadows.add(styles.boxShadow);
+                    shadows.push(styles.boxShadow);
                 }
-            });
+            }
 
             // Extract CSS variables from :root
             const rootStyles = window.getComputedStyle(document.documentElement);
             for (let i = 0; i < rootStyles.length; i++) {
                 const prop = rootStyles[i];
                 if (prop.startsWith('--')) {
-                    tokens.cssVariables[prop] = rootStyles.getPropertyValue(prop).trim();
+                    cssVariables[prop] = rootStyles.getPropertyValue(prop).trim();
                 }
             }
 
-            // Convert Sets to Arrays for JSON
+            // Deduplicate and drop non-colors before crossing the bridge to keep
+            // the JSON payload small
+            const unique = values => Array.from(new Set(values));
+            const skipColors = new Set(['transparent', 'inherit', 'initial', 'rgba(0, 0, 0, 0)']);
             return {
-                colors: Array.from(tokens.colors).filter(c => c && c !== 'rgba(0, 0, 0, 0)'),
-                fonts: Array.from(tokens.fonts),
-                fontSizes: Array.from(tokens.fontSizes),
-                fontWeights: Array.from(tokens.fontWeights),
-                spacing: Array.from(tokens.spacing).filter(s => s && s !== '0px'),
-                borderRadius: Array.from(tokens.borderRadius),
-                shadows: Array.from(tokens.shadows),
-                cssVariables: tokens.cssVariables
+                colors: unique(colors).filter(c => c && !skipColors.has(c)),
+                fonts: unique(fonts),
+                fontSizes: unique(fontSizes),
+                fontWeights: unique(fontWeights),
+                spacing: unique(spacing).filter(s => s && s !== '0px'),
+                borderRadius: unique(borderRadius),
+                shadows: unique(shadows),
+                cssVariables: cssVariables
             };
         }
     """)
 
     # Clean up and organize tokens
     cleaned_tokens = {
-        'colors': _clean_colors(tokens['colors']),
+        'colors': _clean_colors(tuple(tokens['colors'])),
         'typography': {
-            'fonts': _clean_fonts(tokens['fonts']),
-            'sizes': _organize_sizes(tokens['fontSizes']),
+            'fonts': _clean_fonts(tuple(tokens['fonts'])),
+            'sizes': _organize_sizes(tuple(tokens['fontSizes'])),
             'weights': sorted(set(tokens['fontWeights']))
         },
-        'spacing': _organize_spacing(tokens['spacing']),
-        'borderRadius': _organize_sizes(tokens['borderRadius']),
+        'spacing': _organize_spacing(tuple(tokens['spacing'])),
+        'borderRadius': _organize_sizes(tuple(tokens['borderRadius'])),
         'shadows': tokens['shadows'][:10],  # Limit to most common
         'cssVariables': tokens['cssVariables']
     }
@@ -112,16 +116,17 @@ def extract_design_tokens(page):
     return cleaned_tokens
 
 
+# The cleaners below are pure functions of their (tuple) inputs, so repeated
+# pages with the same tokens are served from the cache. They return tuples so
+# cached results cannot be mutated by callers.
+
+@lru_cache(maxsize=128)
 def _clean_colors(colors):
-    """Clean and deduplicate colors"""
-    unique_colors = set()
-    for color in colors:
-        # Convert to hex if possible, or keep as is
-        if color and color not in ['transparent', 'inherit', 'initial']:
-            unique_colors.add(color)
-    return sorted(list(unique_colors))[:20]  # Top 20 colors
+    """Order colors (already deduplicated and filtered in the page)"""
+    return tuple(sorted(colors)[:20])  # Top 20 colors
 
 
+@lru_cache(maxsize=128)
 def _clean_fonts(fonts):
     """Extract primary fonts from font families"""
     primary_fonts = set()
@@ -130,32 +135,31 @@ def _clean_fonts(fonts):
         first_font = font_family.split(',')[0].strip().strip('"\'')
         if first_font and first_font not in ['inherit', 'initial']:
             primary_fonts.add(first_font)
-    return sorted(list(primary_fonts))
+    return tuple(sorted(primary_fonts))
 
 
+@lru_cache(maxsize=128)
 def _organize_sizes(sizes):
     """Organize sizes by converting to px and sorting"""
-    px_sizes = []
+    px_sizes = {}
     for size in sizes:
-        if 'px' in size:
-            try:
-                px_val = float(size.replace('px', ''))
-                px_sizes.append(size)
-            except ValueError:
-                continue
-    return sorted(set(px_sizes), key=lambda x: float(x.replace('px', '')))
+        match = _PX_RE.match(size.strip())
+        if match:
+            px_sizes[match.group(0)] = float(match.group(1))
+    return tuple(sorted(px_sizes, key=px_sizes.get))
 
 
+@lru_cache(maxsize=128)
 def _organize_spacing(spacing_values):
     """Extract unique spacing values"""
-    unique_spacing = set()
+    unique_spacing = {}
     for value in spacing_values:
         # Split multi-value properties (e.g., "10px 20px")
         parts = value.split()
         for part in parts:
             if part and part != '0px':
-                unique_spacing.add(part)
-    return _organize_sizes(list(unique_spacing))
+                unique_spacing[part] = None
+    return _organize_sizes(tuple(unique_spacing))
 
 
 def analyze_layout(page):
@@ -171,42 +175,42 @@ def analyze_layout(page):
             const elements = document.querySelectorAll('*');
 
             elements.forEach(el => {
-                const styles = window.getComputedStyle(el);
+                // Only analyze visible elements with significant size; check the
+                // box first so getComputedStyle only runs for candidates
                 const rect = el.getBoundingClientRect();
+                if (rect.width <= 100 || rect.height <= 50) return;
+
+                const styles = window.getComputedStyle(el);
+                const selector = el.tagName.toLowerCase() +
+                               (el.className ? '.' + el.className.split(' ')[0] : '');
+
+                if (styles.display === 'flex') {
+                    layouts.flex.push({
+                        selector: selector,
+                        direction: styles.flexDirection,
+                        justify: styles.justifyContent,
+                        align: styles.alignItems,
+                        gap: styles.gap
+                    });
+                }
+
+                if (styles.display === 'grid') {
+                    layouts.grid.push({
+                        selector: selector,
+                        columns: styles.gridTemplateColumns,
+                        rows: styles.gridTemplateRows,
+                        gap: styles.gap
+                    });
+                }
 
-                // Only analyze visible elements with significant size
-                if (rect.width > 100 && rect.height > 50) {
-                    const selector = el.tagName.toLowerCase() +
-                                   (el.className ? '.' + el.className.split(' ')[0] : '');
-
-                    if (styles.display === 'flex') {
-                        layouts.flex.push({
-                            selector: selector,
-                            direction: styles.flexDirection,
-                            justify: styles.justifyContent,
-                            align: styles.alignItems,
-                            gap: styles.gap
-                        });
-                    }
-
-                    if (styles.display === 'grid') {
-                        layouts.grid.push({
-                            selector: selector,
-                            columns: styles.gridTemplateColumns,
-                            rows: styles.gridTemplateRows,
-                            gap: styles.gap
-                        });
-                    }
-
-                    // Track main container widths
-                    if (rect.width > window.innerWidth * 0.8) {
-                        layouts.containers.push({
-                            selector: selector,
-                            maxWidth: styles.maxWidth,
-                            width: styles.width,
-                            padding: styles.padding
-                        });
-                    }
+                // Track main container widths
+                if (rect.width > window.innerWidth * 0.8) {
+                    layouts.containers.push({
+                        selector: selector,
+                        maxWidth: styles.maxWidth,
+                        width: styles.width,
+                        padding: styles.padding
+                    });
                 }
             });
 
@@ -272,8 +276,7 @@ def main():
     }
 
     # Save to file
-    with open(args.output, 'w') as f:
-        json.dump(result, f, indent=2)
+    save_json(result, args.output)
 
     print(f"\n✅ Design tokens extracted to {args.output}")
     print(f"   Colors: {len(tokens['colors'])}")
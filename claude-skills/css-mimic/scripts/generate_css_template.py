@@ -63,138 +63,142 @@ p, h1, h2, h3, h4, h5, h6 {
 """
 
 
+# Named font weights used for --font-<name> custom properties
+FONT_WEIGHT_NAMES = {
+    '300': 'light',
+    '400': 'normal',
+    '500': 'medium',
+    '600': 'semibold',
+    '700': 'bold',
+    '800': 'extrabold'
+}
+
+
+def _section(comment, declarations):
+    """Format a commented group of declarations inside :root, ending with a blank line"""
+    lines = "".join(f"  {decl}\n" for decl in declarations)
+    return f"  /* {comment} */\n{lines}\n"
+
+
+def _rule(selector, declarations):
+    """Format a CSS rule followed by a blank line"""
+    body = "".join(f"  {decl}\n" for decl in declarations)
+    return f"{selector} {{\n{body}}}\n"
+
+
 def generate_custom_properties(tokens):
     """Generate CSS custom properties from tokens"""
-    css = ["\n/* =========================================="]
-    css.append("   Design Tokens - CSS Custom Properties")
-    css.append("   ========================================== */\n")
-    css.append(":root {")
+    extracted = tokens.get('tokens', {})
+    sections = []
 
     # Colors
-    if 'colors' in tokens.get('tokens', {}):
-        css.append("  /* Colors */")
-        colors = tokens['tokens']['colors'][:10]  # Limit to 10 most common
-        for i, color in enumerate(colors, 1):
-            css.append(f"  --color-{i}: {color};")
-        css.append("")
+    if 'colors' in extracted:
+        colors = extracted['colors'][:10]  # Limit to 10 most common
+        sections.append(_section("Colors", (
+            f"--color-{i}: {color};" for i, color in enumerate(colors, 1))))
 
     # Typography
-    if 'typography' in tokens.get('tokens', {}):
-        typo = tokens['tokens']['typography']
+    if 'typography' in extracted:
+        typo = extracted['typography']
 
         # Fonts
         if 'fonts' in typo and typo['fonts']:
-            css.append("  /* Typography - Fonts */")
-            primary_font = typo['fonts'][0]
-            css.append(f"  --font-primary: {primary_font}, sans-serif;")
+            fonts = [f"--font-primary: {typo['fonts'][0]}, sans-serif;"]
             if len(typo['fonts']) > 1:
-                css.append(f"  --font-secondary: {typo['fonts'][1]}, serif;")
-            css.append("")
+                fonts.append(f"--font-secondary: {typo['fonts'][1]}, serif;")
+            sections.append(_section("Typography - Fonts", fonts))
 
         # Font sizes
         if 'sizes' in typo and typo['sizes']:
-            css.append("  /* Typography - Sizes */")
             sizes = typo['sizes']
-            if len(sizes) >= 5:
-                css.append(f"  --font-xs: {sizes[0]};")
-                css.append(f"  --font-sm: {sizes[1]};")
-                css.append(f"  --font-base: {sizes[2]};")
-                css.append(f"  --font-lg: {sizes[3]};")
-                css.append(f"  --font-xl: {sizes[4]};")
-            css.append("")
+            scale = zip(('xs', 'sm', 'base', 'lg', 'xl'), sizes) if len(sizes) >= 5 else ()
+            sections.append(_section("Typography - Sizes", (
+                f"--font-{name}: {size};" for name, size in scale)))
 
         # Font weights
         if 'weights' in typo and typo['weights']:
-            css.append("  /* Typography - Weights */")
             weights = sorted(set(typo['weights']))
-            for i, weight in enumerate(weights):
-                name = {
-                    '300': 'light',
-                    '400': 'normal',
-                    '500': 'medium',
-                    '600': 'semibold',
-                    '700': 'bold',
-                    '800': 'extrabold'
-                }.get(weight, f'weight-{i}')
-                css.append(f"  --font-{name}: {weight};")
-            css.append("")
+            sections.append(_section("Typography - Weights", (
+                f"--font-{FONT_WEIGHT_NAMES.get(weight, f'weight-{i}')}: {weight};"
+                for i, weight in enumerate(weights))))
 
     # Spacing
-    if 'spacing' in tokens.get('tokens', {}):
-        css.append("  /* Spacing Scale */")
-        spacing = tokens['tokens']['spacing'][:8]  # Limit to 8 values
-        for i, space in enumerate(spacing, 1):
-            css.append(f"  --space-{i}: {space};")
-        css.append("")
+    if 'spacing' in extracted:
+        spacing = extracted['spacing'][:8]  # Limit to 8 values
+        sections.append(_section("Spacing Scale", (
+            f"--space-{i}: {space};" for i, space in enumerate(spacing, 1))))
 
     # Border radius
-    if 'borderRadius' in tokens.get('tokens', {}):
-        css.append("  /* Border Radius */")
-        radii = tokens['tokens']['borderRadius'][:4]
-        for i, radius in enumerate(radii, 1):
-            css.append(f"  --radius-{i}: {radius};")
-        css.append("")
+    if 'borderRadius' in extracted:
+        radii = extracted['borderRadius'][:4]
+        sections.append(_section("Border Radius", (
+            f"--radius-{i}: {radius};" for i, radius in enumerate(radii, 1))))
 
     # Shadows
-    if 'shadows' in tokens.get('tokens', {}):
-        css.append("  /* Shadows */")
-        shadows = tokens['tokens']['shadows'][:3]
-        for i, shadow in enumerate(shadows, 1):
-            css.append(f"  --shadow-{i}: {shadow};")
-        css.append("")
+    if 'shadows' in extracted:
+        shadows = extracted['shadows'][:3]
+        sections.append(_section("Shadows", (
+            f"--shadow-{i}: {shadow};" for i, shadow in enumerate(shadows, 1))))
 
     # CSS Variables from the site
-    if 'cssVariables' in tokens.get('tokens', {}) and tokens['tokens']['cssVariables']:
-        css.append("  /* Extracted CSS Variables */")
-        for var_name, var_value in list(tokens['tokens']['cssVariables'].items())[:10]:
-            css.append(f"  {var_name}: {var_value};")
-        css.append("")
+    if 'cssVariables' in extracted and extracted['cssVariables']:
+        variables = list(extracted['cssVariables'].items())[:10]
+        sections.append(_section("Extracted CSS Variables", (
+            f"{name}: {value};" for name, value in variables)))
 
-    css.append("}\n")
-    return "\n".join(css)
+    return f"""
+/* ==========================================
+   Design Tokens - CSS Custom Properties
+   ========================================== */
+
+:root {{
+{"".join(sections)}}}
+"""
 
 
 def generate_layout_css(tokens):
     """Generate layout CSS based on extracted patterns"""
-    css = ["\n/* =========================================="]
-    css.append("   Layout Patterns")
-    css.append("   ========================================== */\n")
-
-    # Container
-    css.append("/* Container */")
-    css.append(".container {")
-    css.append("  width: 100%;")
-    css.append("  max-width: 1200px;")
-    css.append("  margin-inline: auto;")
-    css.append("  padding-inline: var(--space-4, 1rem);")
-    css.append("}\n")
+    layout = tokens.get('layout', {})
+    rules = []
 
     # Flex layouts from tokens
-    if 'layout' in tokens and 'flex' in tokens['layout'] and tokens['layout']['flex']:
-        css.append("/* Flex Layouts (extracted from target site) */")
-        for i, flex in enumerate(tokens['layout']['flex'][:3], 1):  # Limit to 3 examples
-            css.append(f".flex-pattern-{i} {{")
-            css.append(f"  display: flex;")
-            css.append(f"  flex-direction: {flex.get('direction', 'row')};")
-            css.append(f"  justify-content: {flex.get('justify', 'flex-start')};")
-            css.append(f"  align-items: {flex.get('align', 'flex-start')};")
+    if layout.get('flex'):
+        rules.append("/* Flex Layouts (extracted from target site) */")
+        for i, flex in enumerate(layout['flex'][:3], 1):  # Limit to 3 examples
+            declarations = [
+                "display: flex;",
+                f"flex-direction: {flex.get('direction', 'row')};",
+                f"justify-content: {flex.get('justify', 'flex-start')};",
+                f"align-items: {flex.get('align', 'flex-start')};",
+            ]
             if flex.get('gap') and flex['gap'] != 'normal':
-                css.append(f"  gap: {flex['gap']};")
-            css.append("}\n")
+                declarations.append(f"gap: {flex['gap']};")
+            rules.append(_rule(f".flex-pattern-{i}", declarations))
 
     # Grid layouts from tokens
-    if 'layout' in tokens and 'grid' in tokens['layout'] and tokens['layout']['grid']:
-        css.append("/* Grid Layouts (extracted from target site) */")
-        for i, grid in enumerate(tokens['layout']['grid'][:2], 1):  # Limit to 2 examples
-            css.append(f".grid-pattern-{i} {{")
-            css.append(f"  display: grid;")
+    if layout.get('grid'):
+        rules.append("/* Grid Layouts (extracted from target site) */")
+        for i, grid in enumerate(layout['grid'][:2], 1):  # Limit to 2 examples
+            declarations = ["display: grid;"]
             if grid.get('columns'):
-                css.append(f"  grid-template-columns: {grid['columns']};")
+                declarations.append(f"grid-template-columns: {grid['columns']};")
             if grid.get('gap') and grid['gap'] != 'normal':
-                css.append(f"  gap: {grid['gap']};")
-            css.append("}\n")
+                declarations.append(f"gap: {grid['gap']};")
+            rules.append(_rule(f".grid-pattern-{i}", declarations))
 
-    return "\n".join(css)
+    return "\n".join(["""
+/* ==========================================
+   Layout Patterns
+   ========================================== */
+
+/* Container */
+.container {
+  width: 100%;
+  max-width: 1200px;
+  margin-inline: auto;
+  padding-inline: var(--space-4, 1rem);
+}
+""", *rules])
 
 
 def generate_typography_css():
@@ -327,8 +331,7 @@ def main():
     final_css = "\n".join(css_parts)
 
     # Save to file
-    with open(args.output, 'w') as f:
-        f.write(final_css)
+    Path(args.output).write_text(final_css, encoding='utf-8')
 
     print(f"\n✅ CSS generated and saved to {args.output}")
     print(f"   Total length: {len(final_css)} characters")
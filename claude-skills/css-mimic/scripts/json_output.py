@@ -0,0 +1,16 @@
+"""
+JSON writer shared by the css-mimic scripts.
+"""
+
+import json
+from pathlib import Path
+
+
+def save_json(data, path):
+    """Save data as indented JSON, using orjson when it is installed"""
+    try:
+        import orjson
+    except ImportError:
+        Path(path).write_text(json.dumps(data, indent=2), encoding='utf-8')
+    else:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
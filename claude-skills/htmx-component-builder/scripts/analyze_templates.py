@@ -8,152 +8,533 @@ Identifies forms, links, and content sections that could benefit from HTMX.
 Usage:
     python analyze_templates.py --path /path/to/templates
     python analyze_templates.py --path /path/to/templates --priority
+    python analyze_templates.py --path /path/to/templates --output json
 """
 
 import argparse
+import codecs
+import contextlib
+import io
+import json
+import mmap
 import os
 import re
+import sys
+from bisect import bisect_left
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Tuple
+from typing import List, Dict
+
+PRIORITY_ICONS = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}
 
 class HTMXOpportunity:
-    def __init__(self, file_path, line_num, opp_type, element, suggestion, priority):
+    # Large trees produce thousands of these; skip the per-instance __dict__
+    __slots__ = ('file_path', 'line_num', 'opp_type', 'suggestion', 'priority',
+                 'element_limit', '_icon')
+
+    def __init__(self, file_path, line_num, opp_type, suggestion, priority, element_limit=None):
         self.file_path = file_path
         self.line_num = line_num
         self.opp_type = opp_type
-        self.element = element
         self.suggestion = suggestion
         self.priority = priority
+        self.element_limit = element_limit
+        self._icon = PRIORITY_ICONS[priority]
+
+    @property
+    def element(self):
+        """Source line of the opportunity, truncated to element_limit if set"""
+        # The reports never show it, so it is re-read on demand instead of
+        # being copied for every hit; each file is read only once
+        lines = _source_lines(self.file_path)
+        line = lines[self.line_num - 1].strip() if self.line_num <= len(lines) else ''
+        if self.element_limit is not None and len(line) > self.element_limit:
+            return line[:self.element_limit] + '...'
+        return line
+
+    def __reduce__(self):
+        # Rebuild from the kind table so results unpickled from pool workers
+        # share the interned strings instead of each carrying fresh copies
+        return (_opportunity, (self.file_path, self.line_num, self.opp_type, self.element_limit))
 
     def __repr__(self):
-        priority_icon = {'high': '🔴', 'medium': '🟡', 'low': '🟢'}[self.priority]
-        return f"{priority_icon} {self.opp_type:15} | {self.file_path}:{self.line_num}\n   └─ {self.suggestion}"
+        return f"{self._icon} {self.opp_type:15} | {self.file_path}:{self.line_num}\n   └─ {self.suggestion}"
 
-def analyze_template_file(file_path: Path) -> List[HTMXOpportunity]:
-    """Analyze a single template file for HTMX opportunities"""
+@lru_cache(maxsize=None)
+def _source_lines(file_path):
+    """A file's lines, split on line feeds only, as every scan path counts them"""
+    # Universal newlines (as in linecache) would also split on a lone '\r'
+    # and number the lines after it differently from the byte scanners
+    try:
+        with open(file_path, encoding='utf-8', newline='') as f:
+            return f.read().split('\n')
+    except (OSError, UnicodeDecodeError):
+        return []
+
+# Opportunity kinds as (type, suggestion, priority). They come from this
+# small fixed set, so each string is interned once here: every instance
+# shares one string per value, and the grouping/priority comparisons hit
+# the identity fast path
+def _kind(opp_type, suggestion, priority):
+    return tuple(map(sys.intern, (opp_type, suggestion, priority)))
+
+SEARCH_FORM = _kind('Search Form',
+                    'Convert to live search with hx-get and hx-trigger="keyup changed delay:500ms"',
+                    'high')
+FORM_SUBMIT = _kind('Form Submit', 'Add hx-post for inline form submission without page reload',
+                    'medium')
+NAV_LINK = _kind('Nav Link', 'Consider hx-boost="true" for progressive enhancement', 'low')
+PAGINATION = _kind('Pagination', 'Use hx-get to load next page without full reload', 'medium')
+CONTENT_LIST = _kind('Content List', 'Consider infinite scroll with hx-trigger="revealed"', 'high')
+DELETE_ACTION = _kind('Delete Action',
+                      'Add hx-delete with confirmation using hx-confirm attribute', 'medium')
+MODAL_TRIGGER = _kind('Modal Trigger',
+                      'Load modal content dynamically with hx-get and hx-target="#modal"', 'medium')
+TAB_NAVIGATION = _kind('Tab Navigation', 'Load tab content dynamically with hx-get', 'low')
+
+_KINDS = {kind[0]: kind for kind in (SEARCH_FORM, FORM_SUBMIT, NAV_LINK, PAGINATION,
+                                      CONTENT_LIST, DELETE_ACTION, MODAL_TRIGGER,
+                                      TAB_NAVIGATION)}
+
+def _opportunity(file_path, line_num, opp_type, element_limit=None):
+    """Rebuild an opportunity from its type, reusing the interned kind strings"""
+    return HTMXOpportunity(file_path, line_num, *_KINDS[opp_type], element_limit)
+
+# Trigger and condition tokens, in alternation order. Whitespace is [^\S\n]
+# so no token can span lines when a whole file is scanned at once.
+def _token_patterns(word):
+    return (
+        ('form', r'<form'),
+        ('link', r'<a href='),
+        ('a', r'<a'),
+        ('button', r'<button'),
+        ('action', r'action='),
+        ('get', r'method="get"'),
+        ('post', r'method="post"'),
+        ('hx', r'hx-'),
+        ('external', r'https?://'),
+        ('anchor', r'href="#'),
+        ('pagination', r'next|prev|previous|page[^\S\n]*\d+'),
+        ('loop', r'\{\{range[^\S\n]+\.' + word + r'+\}\}|\{%[^\S\n]*for\s'),
+        ('delete', r'delete|remove|삭제'),
+        ('modal', r'modal|popup|dialog'),
+        ('tab', r'tab|탭'),
+    )
+
+# Template loops stay case-sensitive like the original check
+_CASE_SENSITIVE = frozenset(('loop',))
+# Any non-ASCII UTF-8 byte counts as a word character in byte scans so
+# Unicode field names still match
+_BYTES_WORD = r'[\w\x80-\xff]'
+_TOKEN_NAMES = tuple(name for name, _ in _token_patterns(_BYTES_WORD))
+
+def _master_pattern(word):
+    # Every token is a zero-width lookahead so one finditer() walk reports
+    # all of them, even where two overlap (e.g. "modal-tab"). The line is
+    # never lowercased; IGNORECASE covers it. Tokens sharing a start position
+    # need care: "<a href=" wins over "<a", so "link" implies "a".
+    groups = []
+    for name, pattern in _token_patterns(word):
+        group = f'(?P<{name}>{pattern})'
+        groups.append(f'(?-i:{group})' if name in _CASE_SENSITIVE else group)
+    return '(?=' + '|'.join(groups) + ')'
+
+_MASTER = re.compile(_master_pattern(r'\w'), re.IGNORECASE)
+# Bytes twin for memory-mapped files
+_MASTER_B = re.compile(_master_pattern(_BYTES_WORD).encode('utf-8'), re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _hyperscan_db():
+    """Compile the tokens into a hyperscan database, or return None without it"""
+    try:
+        import hyperscan
+    except ImportError:
+        return None
+
+    tokens = _token_patterns(_BYTES_WORD)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=[pattern.encode('utf-8') for _, pattern in tokens],
+        ids=list(range(len(tokens))),
+        elements=len(tokens),
+        flags=[0 if name in _CASE_SENSITIVE else hyperscan.HS_FLAG_CASELESS
+               for name, _ in tokens],
+    )
+    return db
+
+# Tokens that make a line clickable for pagination and delete/tab checks
+_LINK_OR_BUTTON = frozenset(('link', 'button'))
+_CLICKABLE = frozenset(('link', 'a', 'button'))
+_LINK_SKIP = frozenset(('hx', 'external', 'anchor'))
+
+# Lowercase literals at least one of which is on every line a trigger can
+# fire on. Most template lines carry none, so scanners gate the fused regex
+# behind them: a plain literal alternation is far cheaper to run over every
+# line than the lookahead pattern. IGNORECASE keeps the gate case-blind
+# without lowercasing each line first.
+_PREFILTER_NEEDLES = (
+    b'<form', b'<a href=', b'next', b'prev', b'page', b'{{range', b'{%',
+    b'delete', b'remove', '삭제'.encode('utf-8'), b'modal', b'popup', b'dialog',
+    b'tab', '탭'.encode('utf-8'),
+)
+_LITERALS_B = re.compile(b'|'.join(re.escape(needle) for needle in _PREFILTER_NEEDLES),
+                         re.IGNORECASE)
+_LITERALS = re.compile(_LITERALS_B.pattern.decode('utf-8'), re.IGNORECASE)
+
+@lru_cache(maxsize=None)
+def _numba_prefilter():
+    """Compile the line prefilter kernel, or return None without numba"""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    width = max(len(needle) for needle in _PREFILTER_NEEDLES)
+    needles = np.zeros((len(_PREFILTER_NEEDLES), width), dtype=np.uint8)
+    lengths = np.array([len(needle) for needle in _PREFILTER_NEEDLES])
+    for k, needle in enumerate(_PREFILTER_NEEDLES):
+        needles[k, :len(needle)] = np.frombuffer(needle, dtype=np.uint8)
+
+    @njit(cache=True)
+    def candidate_lines(buf, needles, lengths):
+        # (line_num, start, end) for every line holding a needle, comparing
+        # ASCII letters case-insensitively. Spans keep the trailing newline,
+        # as readline() does, so tokens ending in \s still match at line end
+        hits = []
+        n = buf.shape[0]
+        line_num, line_start, hit = 1, 0, False
+        for i in range(n):
+            c = buf[i]
+            if c == 10:
+                if hit:
+                    hits.append((line_num, line_start, i + 1))
+                line_num += 1
+                line_start = i + 1
+                hit = False
+                continue
+            if hit:
+                continue
+            for k in range(needles.shape[0]):
+                length = lengths[k]
+                if i + length > n:
+                    continue
+                j = 0
+                while j < length:
+                    b = buf[i + j]
+                    if 65 <= b <= 90:
+                        b += 32
+                    if b != needles[k, j]:
+                        break
+                    j += 1
+                if j == length:
+                    hit = True
+                    break
+        if hit:
+            hits.append((line_num, line_start, n))
+        return hits
+
+    return lambda buf: candidate_lines(buf, needles, lengths)
+
+def _check_form(file_path, line_num, found):
+    # Traditional form submission
+    if 'action' in found and 'get' in found:
+        return HTMXOpportunity(file_path, line_num, *SEARCH_FORM)
+    elif 'action' in found and 'post' in found:
+        return HTMXOpportunity(file_path, line_num, *FORM_SUBMIT)
+
+def _check_link(file_path, line_num, found):
+    # Skip links already using HTMX, external links and anchors
+    if found & _LINK_SKIP:
+        return None
+    return HTMXOpportunity(file_path, line_num, *NAV_LINK, element_limit=80)
+
+def _check_pagination(file_path, line_num, found):
+    if found & _LINK_OR_BUTTON:
+        return HTMXOpportunity(file_path, line_num, *PAGINATION)
+
+def _check_loop(file_path, line_num, found):
+    # Potential infinite scroll over list rendering
+    return HTMXOpportunity(file_path, line_num, *CONTENT_LIST)
+
+def _check_delete(file_path, line_num, found):
+    if found & _CLICKABLE:
+        return HTMXOpportunity(file_path, line_num, *DELETE_ACTION)
+
+def _check_modal(file_path, line_num, found):
+    return HTMXOpportunity(file_path, line_num, *MODAL_TRIGGER)
+
+def _check_tab(file_path, line_num, found):
+    if found & _CLICKABLE:
+        return HTMXOpportunity(file_path, line_num, *TAB_NAVIGATION)
+
+# Trigger group -> check, in report order
+_DISPATCH = {
+    'form': _check_form,
+    'link': _check_link,
+    'pagination': _check_pagination,
+    'loop': _check_loop,
+    'delete': _check_delete,
+    'modal': _check_modal,
+    'tab': _check_tab,
+}
+
+def _check_line(opportunities, file_path, line_num, found):
+    append = opportunities.append
+    for kind, check in _DISPATCH.items():
+        if kind in found:
+            opp = check(file_path, line_num, found)
+            if opp is not None:
+                append(opp)
+
+def _scan_lines(file_path, opportunities):
+    # Read the file once. Partials without a single trigger literal (the
+    # common case in big template trees) are rejected in one bytes pass.
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    if not _LITERALS_B.search(data):
+        data.decode('utf-8')  # still warn about undecodable files
+        return
+
+    # Iterate the buffer one line alive at a time, split on '\n' only like
+    # the byte scanners (a lone '\r' does not end a line). Bound methods
+    # skip the global and attribute lookups on every line.
+    literal_search = _LITERALS.search
+    master_finditer = _MASTER.finditer
+    with io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', newline='\n') as f:
+        for line_num, line in enumerate(f, 1):
+            if not literal_search(line):
+                continue
+            found = {m.lastgroup for m in master_finditer(line)}
+            if found:
+                _check_line(opportunities, file_path, line_num, found)
+
+# Mapped files are checked for valid UTF-8 this many bytes at a time
+UTF8_CHECK_CHUNK = 1024 * 1024
+
+def _check_utf8(mm):
+    """Raise UnicodeDecodeError unless the mapping is valid UTF-8, without decoding it whole"""
+    decode = codecs.getincrementaldecoder('utf-8')().decode
+    for start in range(0, len(mm), UTF8_CHECK_CHUNK):
+        decode(mm[start:start + UTF8_CHECK_CHUNK])
+    decode(b'', final=True)
+
+def _scan_mapped(file_path, opportunities):
+    # Scan the mapped bytes directly; lines are never decoded
+    with open(file_path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, 'MADV_SEQUENTIAL'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+
+        # Reject files that are not UTF-8, as the text-mode line scan does
+        _check_utf8(mm)
+
+        master_finditer = _MASTER_B.finditer
+        prefilter = _numba_prefilter()
+        if prefilter is not None:
+            import numpy as np
+
+            # Only lines the JIT-compiled literal scan flags reach the regex
+            buf = np.frombuffer(mm, dtype=np.uint8)
+            candidates = prefilter(buf)
+            del buf  # the mapping cannot close while a view is exported
+            for line_num, line_start, line_end in candidates:
+                data = mm[line_start:line_end]
+                found = {m.lastgroup for m in master_finditer(data)}
+                if found:
+                    _check_line(opportunities, file_path, line_num, found)
+            return
+
+        # Without numba, walk the mapping line by line behind the literal gate
+        literal_search = _LITERALS_B.search
+        for line_num, data in enumerate(iter(mm.readline, b''), 1):
+            if not literal_search(data):
+                continue
+            found = {m.lastgroup for m in master_finditer(data)}
+            if found:
+                _check_line(opportunities, file_path, line_num, found)
+
+def _newline_offsets(data: bytes) -> List[int]:
+    """Sorted offsets of every newline in data, for bisecting match offsets"""
+    try:
+        import numpy as np
+    except ImportError:
+        return [m.start() for m in re.finditer(b'\n', data)]
+    return np.flatnonzero(np.frombuffer(data, dtype=np.uint8) == 10).tolist()
+
+def _scan_hyperscan(db, file_path, opportunities):
+    # hyperscan reports every token match in one pass over the file; matches
+    # are bucketed by line and each line is then checked like the others.
+    # The newline index is built once, so each match costs one O(log n)
+    # bisect instead of a count from the start of the file.
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    # Matches are taken from the raw bytes, but a file that is not valid
+    # UTF-8 is rejected with a warning like on the other scan paths
+    data.decode('utf-8')
+    newlines = _newline_offsets(data)
+
+    lines = {}
+    def on_match(token_id, start, end, flags, context):
+        # Count newlines strictly before the match's last byte; a loop token
+        # may end on the line's own newline
+        line_num = bisect_left(newlines, end - 1) + 1
+        lines.setdefault(line_num, set()).add(_TOKEN_NAMES[token_id])
+
+    db.scan(data, match_event_handler=on_match)
+
+    for line_num in sorted(lines):
+        _check_line(opportunities, file_path, line_num, lines[line_num])
+
+# Files at least this big are memory-mapped and scanned as bytes
+MMAP_MIN_BYTES = 256 * 1024
+
+def _analyze_file(file_path: str):
+    """Scan one file; returns (opportunities, None), or (None, warning) when it cannot be read"""
+    # Runs in pool workers, so it never prints: a worker started with spawn
+    # or forkserver does not inherit the parent's stdout redirection
     opportunities = []
 
+    # A decode error can surface mid-file, so it drops partial results
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-    except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}")
-        return opportunities
-
-    for line_num, line in enumerate(lines, 1):
-        line_lower = line.lower()
-
-        # Check for forms
-        if '<form' in line_lower:
-            # Traditional form submission
-            if 'action=' in line_lower and 'method="get"' in line_lower:
-                opportunities.append(HTMXOpportunity(
-                    file_path=file_path,
-                    line_num=line_num,
-                    opp_type='Search Form',
-                    element=line.strip(),
-                    suggestion='Convert to live search with hx-get and hx-trigger="keyup changed delay:500ms"',
-                    priority='high'
-                ))
-            elif 'action=' in line_lower and 'method="post"' in line_lower:
-                opportunities.append(HTMXOpportunity(
-                    file_path=file_path,
-                    line_num=line_num,
-                    opp_type='Form Submit',
-                    element=line.strip(),
-                    suggestion='Add hx-post for inline form submission without page reload',
-                    priority='medium'
-                ))
-
-        # Check for navigation links
-        if '<a href=' in line_lower and 'hx-' not in line_lower:
-            # Skip external links
-            if 'http://' not in line_lower and 'https://' not in line_lower:
-                # Skip anchors
-                if 'href="#' not in line_lower:
-                    opportunities.append(HTMXOpportunity(
-                        file_path=file_path,
-                        line_num=line_num,
-                        opp_type='Nav Link',
-                        element=line.strip()[:80] + '...' if len(line.strip()) > 80 else line.strip(),
-                        suggestion='Consider hx-boost="true" for progressive enhancement',
-                        priority='low'
-                    ))
-
-        # Check for pagination
-        if re.search(r'(next|prev|previous|page\s*\d+)', line_lower):
-            if '<a href=' in line_lower or '<button' in line_lower:
-                opportunities.append(HTMXOpportunity(
-                    file_path=file_path,
-                    line_num=line_num,
-                    opp_type='Pagination',
-                    element=line.strip(),
-                    suggestion='Use hx-get to load next page without full reload',
-                    priority='medium'
-                ))
-
-        # Check for potential infinite scroll
-        if re.search(r'{{range\s+\.\w+}}', line) or re.search(r'{%\s*for\s+', line):
-            # Look for list rendering
-            opportunities.append(HTMXOpportunity(
-                file_path=file_path,
-                line_num=line_num,
-                opp_type='Content List',
-                element=line.strip(),
-                suggestion='Consider infinite scroll with hx-trigger="revealed"',
-                priority='high'
-            ))
-
-        # Check for delete buttons
-        if re.search(r'delete|remove|삭제', line_lower):
-            if '<button' in line_lower or '<a' in line_lower:
-                opportunities.append(HTMXOpportunity(
-                    file_path=file_path,
-                    line_num=line_num,
-                    opp_type='Delete Action',
-                    element=line.strip(),
-                    suggestion='Add hx-delete with confirmation using hx-confirm attribute',
-                    priority='medium'
-                ))
-
-        # Check for modal triggers
-        if re.search(r'modal|popup|dialog', line_lower):
-            opportunities.append(HTMXOpportunity(
-                file_path=file_path,
-                line_num=line_num,
-                opp_type='Modal Trigger',
-                element=line.strip(),
-                suggestion='Load modal content dynamically with hx-get and hx-target="#modal"',
-                priority='medium'
-            ))
-
-        # Check for tabs
-        if re.search(r'tab|탭', line_lower):
-            if '<button' in line_lower or '<a' in line_lower:
-                opportunities.append(HTMXOpportunity(
-                    file_path=file_path,
-                    line_num=line_num,
-                    opp_type='Tab Navigation',
-                    element=line.strip(),
-                    suggestion='Load tab content dynamically with hx-get',
-                    priority='low'
-                ))
-
-    return opportunities
-
-def analyze_templates(template_dir: Path) -> Dict[str, List[HTMXOpportunity]]:
-    """Analyze all template files in directory"""
+        db = _hyperscan_db()
+        if db is not None:
+            _scan_hyperscan(db, file_path, opportunities)
+        elif os.path.getsize(file_path) >= MMAP_MIN_BYTES:
+            _scan_mapped(file_path, opportunities)
+        else:
+            _scan_lines(file_path, opportunities)
+    except (OSError, UnicodeDecodeError) as e:
+        return None, f"Warning: Could not read {file_path}: {e}"
+
+    return opportunities, None
+
+def analyze_template_file(file_path: Path) -> List[HTMXOpportunity]:
+    """Analyze a single template file for HTMX opportunities"""
+    # Plain str paths keep opportunities cheap to pickle back from workers
+    opportunities, warning = _analyze_file(str(file_path))
+    if warning:
+        print(warning)
+    return opportunities or []
+
+TEMPLATE_SUFFIXES = ('.html', '.tmpl')
+
+def _find_templates(root: str):
+    """Yield template file paths under root in a single directory walk"""
+    stack = [root]
+    while stack:
+        # Skip directories that cannot be listed, as rglob() did
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(TEMPLATE_SUFFIXES):
+                    yield entry.path
+
+# Below this many files, process pool startup costs more than it saves
+PARALLEL_MIN_FILES = 64
+
+# Results of earlier runs, keyed by absolute file path. Bump CACHE_VERSION
+# when the scan rules change; edits to this script invalidate it as well.
+# The cache is plain JSON in the per-user cache directory, so loading it
+# never runs code and scanning a checkout leaves nothing behind in it.
+CACHE_VERSION = 5
+
+def default_cache_file() -> str:
+    """Per-user results cache path ($XDG_CACHE_HOME or ~/.cache)"""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'htmx-component-builder', 'analyze_templates.json')
+
+def _cache_stamp():
+    return [CACHE_VERSION, os.stat(__file__).st_mtime_ns]
+
+def _load_cache(cache_path: str) -> dict:
+    """Load cached per-file results, or an empty cache if missing or stale"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('stamp') != _cache_stamp():
+        return {}
+    files = cache.get('files')
+    return files if isinstance(files, dict) else {}
+
+def _save_cache(cache_path: str, files: dict):
+    """Atomically replace the cache file"""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'stamp': _cache_stamp(), 'files': files}, f, ensure_ascii=False)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Warning: Could not write cache {cache_path}: {e}", file=sys.stderr)
+
+def _scan_files(html_files: List[str]) -> list:
+    """Analyze files in order, across processes for large batches"""
+    if len(html_files) < PARALLEL_MIN_FILES:
+        return list(map(_analyze_file, html_files))
+
+    # Files are independent, so scan them across processes (the GIL would
+    # serialize threads). map() keeps results in file order.
+    chunksize = max(1, len(html_files) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(_analyze_file, html_files, chunksize=chunksize))
+
+def analyze_templates(template_dir: Path, use_cache: bool = False,
+                      cache_file: str = None) -> Dict[str, List[HTMXOpportunity]]:
+    """Analyze all template files in directory; use_cache reads and updates the results cache"""
     all_opportunities = {}
+    if cache_file is None:
+        cache_file = default_cache_file()
 
     # Find all HTML template files
-    html_files = list(template_dir.rglob('*.html')) + list(template_dir.rglob('*.tmpl'))
+    html_files = sorted(_find_templates(str(template_dir)))
 
     print(f"Scanning {len(html_files)} template files...\n")
 
+    # Reuse results for files whose mtime and size are unchanged
+    cache = _load_cache(cache_file) if use_cache else {}
+    stats = {}
+    results = {}
     for html_file in html_files:
-        opportunities = analyze_template_file(html_file)
-        if opportunities:
-            all_opportunities[str(html_file)] = opportunities
+        try:
+            st = os.stat(html_file)
+        except OSError:
+            continue  # the scan reports unreadable files
+        stats[html_file] = (st.st_mtime_ns, st.st_size)
+        entry = cache.get(os.path.abspath(html_file))
+        if entry is not None and tuple(entry[:2]) == stats[html_file]:
+            results[html_file] = [_opportunity(html_file, *fields) for fields in entry[2]]
+
+    # Workers only return data; their warnings are printed here, in file order
+    stale = [html_file for html_file in html_files if html_file not in results]
+    for html_file, (opportunities, warning) in zip(stale, _scan_files(stale)):
+        if warning:
+            print(warning)
+        results[html_file] = opportunities
+
+    # Opportunities are cached as (line, type, element limit); the type
+    # restores the interned suggestion and priority. Unreadable files are
+    # left out so their warning shows up again next run.
+    if use_cache:
+        _save_cache(cache_file, {
+            os.path.abspath(html_file): stats[html_file] + (
+                [(o.line_num, o.opp_type, o.element_limit) for o in results[html_file]],)
+            for html_file in html_files
+            if html_file in stats and results[html_file] is not None
+        })
+
+    for html_file in html_files:
+        if results[html_file]:
+            all_opportunities[html_file] = results[html_file]
 
     return all_opportunities
 
@@ -165,6 +546,10 @@ def print_opportunities(opportunities: Dict[str, List[HTMXOpportunity]], show_pr
         print("   Your templates might already be using HTMX, or are simple static pages.")
         return
 
+    # Collect the report and write it once instead of one print() per line
+    out = []
+    emit = out.append
+
     # Group by type
     by_type = {}
     for file_path, opps in opportunities.items():
@@ -173,72 +558,89 @@ def print_opportunities(opportunities: Dict[str, List[HTMXOpportunity]], show_pr
                 by_type[opp.opp_type] = []
             by_type[opp.opp_type].append(opp)
 
-    print(f"{'='*80}")
-    print(f"HTMX Conversion Opportunities Found: {sum(len(opps) for opps in opportunities.values())}")
-    print(f"{'='*80}\n")
+    emit(f"{'='*80}")
+    emit(f"HTMX Conversion Opportunities Found: {sum(len(opps) for opps in opportunities.values())}")
+    emit(f"{'='*80}\n")
 
     # Print by type
     for opp_type, opps in sorted(by_type.items(), key=lambda x: len(x[1]), reverse=True):
-        print(f"\n{opp_type} ({len(opps)} found)")
-        print(f"{'-'*80}")
+        emit(f"\n{opp_type} ({len(opps)} found)")
+        emit(f"{'-'*80}")
 
         # Group by priority if requested
         if show_priority:
-            high = [o for o in opps if o.priority == 'high']
-            medium = [o for o in opps if o.priority == 'medium']
-            low = [o for o in opps if o.priority == 'low']
+            by_priority = {'high': [], 'medium': [], 'low': []}
+            for o in opps:
+                by_priority[o.priority].append(o)
+            high, medium, low = by_priority['high'], by_priority['medium'], by_priority['low']
 
             if high:
-                print(f"\n  🔴 High Priority ({len(high)})")
+                emit(f"\n  🔴 High Priority ({len(high)})")
                 for opp in high[:5]:  # Show first 5
-                    print(f"     {opp.file_path}:{opp.line_num}")
-                    print(f"     └─ {opp.suggestion}\n")
+                    emit(f"     {opp.file_path}:{opp.line_num}")
+                    emit(f"     └─ {opp.suggestion}\n")
 
             if medium:
-                print(f"\n  🟡 Medium Priority ({len(medium)})")
+                emit(f"\n  🟡 Medium Priority ({len(medium)})")
                 for opp in medium[:3]:  # Show first 3
-                    print(f"     {opp.file_path}:{opp.line_num}")
-                    print(f"     └─ {opp.suggestion}\n")
+                    emit(f"     {opp.file_path}:{opp.line_num}")
+                    emit(f"     └─ {opp.suggestion}\n")
 
             if low:
-                print(f"\n  🟢 Low Priority ({len(low)})")
-                print(f"     {len(low)} opportunities found (use --verbose to see all)\n")
+                emit(f"\n  🟢 Low Priority ({len(low)})")
+                emit(f"     {len(low)} opportunities found (use --verbose to see all)\n")
         else:
             # Just show counts
             for opp in opps[:3]:
-                print(f"  {opp}")
+                emit(f"  {opp}")
 
             if len(opps) > 3:
-                print(f"  ... and {len(opps) - 3} more")
+                emit(f"  ... and {len(opps) - 3} more")
 
     # Summary and recommendations
-    print(f"\n{'='*80}")
-    print("Priority Recommendations")
-    print(f"{'='*80}\n")
+    emit(f"\n{'='*80}")
+    emit("Priority Recommendations")
+    emit(f"{'='*80}\n")
 
     # Count priorities
-    high_priority = sum(1 for opps in opportunities.values() for o in opps if o.priority == 'high')
-    medium_priority = sum(1 for opps in opportunities.values() for o in opps if o.priority == 'medium')
-    low_priority = sum(1 for opps in opportunities.values() for o in opps if o.priority == 'low')
+    counts = Counter(o.priority for opps in opportunities.values() for o in opps)
+    high_priority, medium_priority, low_priority = counts['high'], counts['medium'], counts['low']
 
-    print(f"🔴 High Priority:   {high_priority:3} - Start here for maximum impact")
-    print(f"🟡 Medium Priority: {medium_priority:3} - Good value-to-effort ratio")
-    print(f"🟢 Low Priority:    {low_priority:3} - Nice to have, low urgency\n")
+    emit(f"🔴 High Priority:   {high_priority:3} - Start here for maximum impact")
+    emit(f"🟡 Medium Priority: {medium_priority:3} - Good value-to-effort ratio")
+    emit(f"🟢 Low Priority:    {low_priority:3} - Nice to have, low urgency\n")
 
     # Specific recommendations
-    print("Suggested Implementation Order:")
-    print("1. Convert search forms to live search (high user value)")
-    print("2. Add infinite scroll to content lists (better UX)")
-    print("3. Make forms submit inline (reduce page reloads)")
-    print("4. Convert delete actions to HTMX (add confirmations)")
-    print("5. Progressive enhancement for navigation (hx-boost)\n")
-
-    print("Next Steps:")
-    print("1. Pick highest priority opportunity")
-    print("2. Generate component:")
-    print("   python scripts/generate_component.py --type [type] --name [name] --korean --go-handler")
-    print("3. Integrate into your template")
-    print("4. Test and iterate\n")
+    emit("Suggested Implementation Order:")
+    emit("1. Convert search forms to live search (high user value)")
+    emit("2. Add infinite scroll to content lists (better UX)")
+    emit("3. Make forms submit inline (reduce page reloads)")
+    emit("4. Convert delete actions to HTMX (add confirmations)")
+    emit("5. Progressive enhancement for navigation (hx-boost)\n")
+
+    emit("Next Steps:")
+    emit("1. Pick highest priority opportunity")
+    emit("2. Generate component:")
+    emit("   python scripts/generate_component.py --type [type] --name [name] --korean --go-handler")
+    emit("3. Integrate into your template")
+    emit("4. Test and iterate\n")
+
+    sys.stdout.write('\n'.join(out) + '\n')
+
+def print_json(opportunities: Dict[str, List[HTMXOpportunity]]):
+    """Write found opportunities to stdout as one JSON array"""
+    result = [
+        {'file': opp.file_path, 'line': opp.line_num, 'type': opp.opp_type,
+         'priority': opp.priority, 'suggestion': opp.suggestion}
+        for opps in opportunities.values() for opp in opps
+    ]
+    try:
+        import orjson
+    except ImportError:
+        sys.stdout.write(json.dumps(result, ensure_ascii=False) + '\n')
+    else:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(result, option=orjson.OPT_APPEND_NEWLINE))
 
 def main():
     parser = argparse.ArgumentParser(
@@ -254,6 +656,12 @@ Examples:
 
   # Verbose output
   python analyze_templates.py --path /path/to/templates --verbose
+
+  # Machine-readable output for other tools
+  python analyze_templates.py --path /path/to/templates --output json
+
+  # Rescan everything, ignoring results cached from earlier runs
+  python analyze_templates.py --path /path/to/templates --no-cache
         '''
     )
 
@@ -263,6 +671,12 @@ Examples:
                         help='Show priority breakdown')
     parser.add_argument('--verbose', action='store_true',
                         help='Show all opportunities (not just summary)')
+    parser.add_argument('--output', choices=['text', 'json'], default='text',
+                        help='Report format; json writes a machine-readable array (default: text)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Rescan every file and skip the results cache')
+    parser.add_argument('--cache-file', type=str, default=None,
+                        help=f'Results cache file (default: {default_cache_file()})')
 
     args = parser.parse_args()
 
@@ -275,8 +689,17 @@ Examples:
         print(f"Error: Not a directory: {template_dir}")
         return 1
 
+    if args.output == 'json':
+        # Keep stdout clean for the JSON; progress and warnings go to stderr
+        with contextlib.redirect_stdout(sys.stderr):
+            opportunities = analyze_templates(template_dir, use_cache=not args.no_cache,
+                                              cache_file=args.cache_file)
+        print_json(opportunities)
+        return 0
+
     # Analyze templates
-    opportunities = analyze_templates(template_dir)
+    opportunities = analyze_templates(template_dir, use_cache=not args.no_cache,
+                                      cache_file=args.cache_file)
 
     # Print results
     print_opportunities(opportunities, show_priority=args.priority)
@@ -284,5 +707,4 @@ Examples:
     return 0
 
 if __name__ == '__main__':
-    import sys
     sys.exit(main())
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+Component Template Precompiler
+
+Compiles the Jinja2 templates used by generate_component.py into a zip of
+Python modules. When the zip is newer than every template, the generator
+loads it instead of parsing the template sources. Re-run after editing
+anything in templates/.
+
+Usage:
+    python build_template_cache.py [--output <file.zip>]
+
+Example:
+    python build_template_cache.py
+"""
+
+import argparse
+import sys
+
+from generate_component import COMPILED_TEMPLATES, template_environment
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Precompile HTMX component templates')
+    parser.add_argument('--output', '-o', default=str(COMPILED_TEMPLATES),
+                        help=f'Output zip file (default: {COMPILED_TEMPLATES.name} next to the generator)')
+
+    args = parser.parse_args()
+
+    # Always compile from the template sources, never from a previous build
+    env = template_environment(use_cache=False, precompiled=False)
+    if env is None:
+        return 1
+
+    env.compile_templates(args.output, extensions=['j2'], zip='deflated', ignore_errors=False)
+    print(f"✅ Compiled {len(env.list_templates(extensions=['j2']))} templates to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -7,6 +7,7 @@ Korean optimization, and Dark project integration.
 
 Usage:
     python generate_component.py --type search --name topic-search --korean --go-handler
+    python generate_component.py --batch components.json --output /path/to/project/
 
 Component Types:
     - search: Live search with debouncing
@@ -25,96 +26,36 @@ Component Types:
     - realtime: Real-time updates
 """
 
-import argparse
 import os
 import sys
+from collections import ChainMap
+from functools import lru_cache
 from pathlib import Path
-from datetime import datetime
 
-# Component templates
+from templating import TIMESTAMP_FORMAT, TIMESTAMP_SLOT, jinja_environment, newest_mtime
+
+# Templates live in templates/; only the ones a run asks for are read and compiled
+TEMPLATE_DIR = Path(__file__).resolve().parent / 'templates'
+
+# Precompiled template modules written by build_template_cache.py
+COMPILED_TEMPLATES = TEMPLATE_DIR.parent / 'component_templates.zip'
+
+# Localized messages the Go handlers send back, interned once and shared by
+# every render that embeds them
+_MSG_SEARCH_EMPTY = sys.intern('검색어를 입력하세요')
+_MSG_SEARCH_ERROR = sys.intern('검색 중 오류가 발생했습니다')
+_MSG_CONTENT_LOAD_ERROR = sys.intern('콘텐츠를 불러오는 중 오류가 발생했습니다')
+_MSG_CONTENT_UNAVAILABLE = sys.intern('콘텐츠를 불러올 수 없습니다')
+_MSG_CONTENT_NOT_FOUND = sys.intern('콘텐츠를 찾을 수 없습니다')
+_MSG_SAVE_ERROR = sys.intern('저장 중 오류가 발생했습니다')
+_MSG_SAVE_SUCCESS = sys.intern('저장되었습니다')
+_MSG_REQUIRED = sys.intern('필수 입력 항목입니다')
+
+# Component template files and default parameters
 COMPONENTS = {
     'search': {
-        'html': '''<!-- Live Search Component -->
-<!-- Generated: {timestamp} -->
-<form class="search-form korean-text"
-      role="search"
-      hx-get="{api_endpoint}"
-      hx-trigger="keyup changed delay:{debounce}ms, search"
-      hx-target="#{target_id}"
-      hx-indicator="#{indicator_id}">
-
-    <label for="{input_id}" class="sr-only">{label_text}</label>
-    <input type="search"
-           id="{input_id}"
-           name="q"
-           class="search-input"
-           placeholder="{placeholder_text}"
-           autocomplete="off"
-           aria-label="{aria_label}">
-
-    <button type="submit" class="search-btn" aria-label="{button_label}">
-        🔍
-    </button>
-</form>
-
-<!-- Search Results Container -->
-<div id="{target_id}" class="search-results">
-    <!-- Results will be loaded here -->
-</div>
-
-<!-- Loading Indicator -->
-<div id="{indicator_id}" class="htmx-indicator korean-text">
-    {loading_text}
-</div>
-
-{ime_script}
-''',
-        'go_handler': '''package handlers
-
-import (
-\t"net/http"
-\t"strings"
-
-\t"github.com/go-chi/chi/v5"
-)
-
-// {HandlerName} handles live search requests
-// HTMX endpoint: GET {api_endpoint}
-func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
-\t// Extract search query
-\tquery := r.URL.Query().Get("q")
-\tif query == "" {{
-\t\tw.WriteHeader(http.StatusOK)
-\t\tw.Write([]byte("<p class='text-muted korean-text'>{empty_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Perform search (implement your search logic)
-\tresults, err := h.searchService.Search(r.Context(), query)
-\tif err != nil {{
-\t\tw.WriteHeader(http.StatusInternalServerError)
-\t\tw.Write([]byte("<p class='text-muted korean-text'>{error_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Check if HTMX request
-\tif r.Header.Get("HX-Request") != "true" {{
-\t\t// Handle non-HTMX request (return full page)
-\t\th.renderFullSearchPage(w, r, query, results)
-\t\treturn
-\t}}
-
-\t// Render search results partial
-\terr = h.tmpl.ExecuteTemplate(w, "search-results", map[string]interface{{}}{{
-\t\t"Query":   query,
-\t\t"Results": results,
-\t\t"Total":   len(results),
-\t}})
-\tif err != nil {{
-\t\thttp.Error(w, err.Error(), http.StatusInternalServerError)
-\t}}
-}}
-''',
+        'html': 'search.html.j2',
+        'go_handler': 'search.go.j2',
         'params': {
             'api_endpoint': '/api/search',
             'target_id': 'search-results',
@@ -126,90 +67,14 @@ func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
             'aria_label': '검색어 입력',
             'button_label': '검색',
             'loading_text': '검색 중...',
-            'empty_message': '검색어를 입력하세요',
-            'error_message': '검색 중 오류가 발생했습니다',
+            'empty_message': _MSG_SEARCH_EMPTY,
+            'error_message': _MSG_SEARCH_ERROR,
         }
     },
 
     'infinite-scroll': {
-        'html': '''<!-- Infinite Scroll Component -->
-<!-- Generated: {timestamp} -->
-<div id="{container_id}" class="{container_class}">
-    {{{{range .{ContentVar}}}}}
-        {{{{template "{item_template}" .}}}}
-    {{{{end}}}}
-</div>
-
-<!-- Scroll Trigger (loads next page when visible) -->
-<div hx-get="{api_endpoint}?page={{{{.NextPage}}}}"
-     hx-trigger="revealed"
-     hx-swap="afterend"
-     hx-target="#{container_id}"
-     hx-indicator="#{indicator_id}">
-</div>
-
-<!-- Loading Indicator -->
-<div id="{indicator_id}" class="htmx-indicator korean-text" style="text-align: center; padding: var(--space-4);">
-    {loading_text}
-</div>
-
-<!-- End of Content Message -->
-{{{{if not .HasMore}}}}
-<div class="text-center text-muted korean-text" style="padding: var(--space-6);">
-    {end_message}
-</div>
-{{{{end}}}}
-''',
-        'go_handler': '''package handlers
-
-import (
-\t"net/http"
-\t"strconv"
-
-\t"github.com/go-chi/chi/v5"
-)
-
-// {HandlerName} handles infinite scroll pagination
-// HTMX endpoint: GET {api_endpoint}
-func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
-\t// Parse page number
-\tpageStr := r.URL.Query().Get("page")
-\tpage, err := strconv.Atoi(pageStr)
-\tif err != nil || page < 1 {{
-\t\tpage = 1
-\t}}
-
-\t// Load content with pagination (implement your logic)
-\tcontent, hasMore, err := h.contentService.LoadPage(r.Context(), page, {PageSize})
-\tif err != nil {{
-\t\tw.WriteHeader(http.StatusInternalServerError)
-\t\tw.Write([]byte("<p class='text-muted korean-text'>{error_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Check if HTMX request
-\tif r.Header.Get("HX-Request") != "true" {{
-\t\t// Handle non-HTMX request (return full page)
-\t\th.renderFullContentPage(w, r, content, page, hasMore)
-\t\treturn
-\t}}
-
-\t// Send trigger if no more content
-\tif !hasMore {{
-\t\tw.Header().Set("HX-Trigger", "noMoreContent")
-\t}}
-
-\t// Render content items partial
-\terr = h.tmpl.ExecuteTemplate(w, "{item_template}", map[string]interface{{}}{{
-\t\t"{ContentVar}": content,
-\t\t"NextPage":     page + 1,
-\t\t"HasMore":      hasMore,
-\t}})
-\tif err != nil {{
-\t\thttp.Error(w, err.Error(), http.StatusInternalServerError)
-\t}}
-}}
-''',
+        'html': 'infinite-scroll.html.j2',
+        'go_handler': 'infinite-scroll.go.j2',
         'params': {
             'container_id': 'content-list',
             'container_class': 'content-previews',
@@ -219,169 +84,15 @@ func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
             'indicator_id': 'scroll-loading',
             'loading_text': '로딩 중...',
             'end_message': '모든 콘텐츠를 불러왔습니다',
-            'error_message': '콘텐츠를 불러오는 중 오류가 발생했습니다',
+            'error_message': _MSG_CONTENT_LOAD_ERROR,
             'PageSize': '20',
         }
     },
 
     'modal': {
-        'html': '''<!-- Modal Component -->
-<!-- Generated: {timestamp} -->
-
-<!-- Modal Trigger -->
-<a href="{content_url}"
-   hx-get="{api_endpoint}"
-   hx-target="#{modal_id}"
-   hx-swap="innerHTML"
-   class="{trigger_class}">
-    {trigger_text}
-</a>
-
-<!-- Modal Container -->
-<div id="{modal_id}" class="modal" style="display: none;">
-    <!-- Modal content loaded here -->
-</div>
-
-<!-- Modal Template -->
-<template id="modal-template">
-    <div class="modal-backdrop" onclick="this.parentElement.style.display='none'"></div>
-    <div class="modal-dialog" role="dialog" aria-modal="true">
-        <div class="modal-header">
-            <h2 class="modal-title korean-text">{{{{.Title}}}}</h2>
-            <button class="modal-close"
-                    onclick="document.getElementById('{modal_id}').style.display='none'"
-                    aria-label="{close_label}">
-                ✕
-            </button>
-        </div>
-        <div class="modal-body korean-text">
-            {{{{.Content}}}}
-        </div>
-        <div class="modal-footer">
-            <button class="btn-primary"
-                    onclick="document.getElementById('{modal_id}').style.display='none'">
-                {confirm_text}
-            </button>
-        </div>
-    </div>
-</template>
-
-<style>
-.modal {{
-    position: fixed;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    z-index: 1000;
-    display: flex;
-    align-items: center;
-    justify-content: center;
-}}
-
-.modal-backdrop {{
-    position: absolute;
-    top: 0;
-    left: 0;
-    width: 100%;
-    height: 100%;
-    background: rgba(0, 0, 0, 0.5);
-    backdrop-filter: blur(4px);
-}}
-
-.modal-dialog {{
-    position: relative;
-    background: var(--color-bg);
-    border-radius: var(--radius-lg);
-    box-shadow: var(--shadow-xl);
-    max-width: 600px;
-    width: 90%;
-    max-height: 80vh;
-    overflow-y: auto;
-}}
-
-.modal-header {{
-    display: flex;
-    align-items: center;
-    justify-content: space-between;
-    padding: var(--space-6);
-    border-bottom: 1px solid var(--border);
-}}
-
-.modal-body {{
-    padding: var(--space-6);
-}}
-
-.modal-footer {{
-    padding: var(--space-6);
-    border-top: 1px solid var(--border);
-    display: flex;
-    justify-content: flex-end;
-    gap: var(--space-3);
-}}
-
-.modal-close {{
-    background: none;
-    border: none;
-    font-size: var(--font-xl);
-    cursor: pointer;
-    color: var(--foreground-muted);
-}}
-</style>
-
-<script>
-// Show modal when content loaded
-document.body.addEventListener('htmx:afterSwap', function(evt) {{
-    if (evt.detail.target.id === '{modal_id}') {{
-        evt.detail.target.style.display = 'flex';
-    }}
-}});
-
-// Close on ESC key
-document.addEventListener('keydown', function(evt) {{
-    if (evt.key === 'Escape') {{
-        document.getElementById('{modal_id}').style.display = 'none';
-    }}
-}});
-</script>
-''',
-        'go_handler': '''package handlers
-
-import (
-\t"net/http"
-
-\t"github.com/go-chi/chi/v5"
-)
-
-// {HandlerName} loads content for modal
-// HTMX endpoint: GET {api_endpoint}
-func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
-\t// Extract content ID from URL
-\tcontentID := chi.URLParam(r, "id")
-\tif contentID == "" {{
-\t\tw.WriteHeader(http.StatusBadRequest)
-\t\tw.Write([]byte("<p class='text-muted korean-text'>{error_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Load content (implement your logic)
-\tcontent, err := h.contentService.GetByID(r.Context(), contentID)
-\tif err != nil {{
-\t\tw.WriteHeader(http.StatusNotFound)
-\t\tw.Write([]byte("<p class='text-muted korean-text'>{not_found_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Render modal content
-\terr = h.tmpl.ExecuteTemplate(w, "modal-content", map[string]interface{{}}{{
-\t\t"Title":   content.Title,
-\t\t"Content": content.BodyHTML,
-\t}})
-\tif err != nil {{
-\t\thttp.Error(w, err.Error(), http.StatusInternalServerError)
-\t}}
-}}
-''',
+        'html': 'modal.html.j2',
+        'go_handler': 'modal.go.j2',
+        'style': 'modal.css',
         'params': {
             'modal_id': 'content-modal',
             'api_endpoint': '/api/content/{id}/modal',
@@ -390,155 +101,15 @@ func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
             'trigger_text': '{{.Title}}',
             'close_label': '닫기',
             'confirm_text': '확인',
-            'error_message': '콘텐츠를 불러올 수 없습니다',
-            'not_found_message': '콘텐츠를 찾을 수 없습니다',
+            'error_message': _MSG_CONTENT_UNAVAILABLE,
+            'not_found_message': _MSG_CONTENT_NOT_FOUND,
         }
     },
 
     'form': {
-        'html': '''<!-- Server-Validated Form Component -->
-<!-- Generated: {timestamp} -->
-<form hx-post="{api_endpoint}"
-      hx-target="#{form_id}"
-      hx-swap="outerHTML"
-      hx-indicator="#{indicator_id}"
-      id="{form_id}"
-      class="korean-text">
-
-    <!-- Form Fields -->
-    <div class="form-group">
-        <label for="{field_id}">{field_label}</label>
-        <input type="text"
-               id="{field_id}"
-               name="{field_name}"
-               class="form-input"
-               required
-               aria-describedby="{field_id}-error">
-        <div id="{field_id}-error" class="form-error"></div>
-    </div>
-
-    <!-- Submit Button -->
-    <div class="form-actions">
-        <button type="submit" class="btn-primary">
-            {submit_text}
-        </button>
-        <button type="reset" class="btn-secondary">
-            {reset_text}
-        </button>
-    </div>
-
-    <!-- Loading Indicator -->
-    <div id="{indicator_id}" class="htmx-indicator korean-text">
-        {loading_text}
-    </div>
-</form>
-
-<style>
-.form-group {{
-    margin-bottom: var(--space-4);
-}}
-
-.form-group label {{
-    display: block;
-    margin-bottom: var(--space-2);
-    font-weight: var(--font-medium);
-}}
-
-.form-input {{
-    width: 100%;
-    padding: var(--space-3);
-    border: 1px solid var(--border);
-    border-radius: var(--radius-md);
-    font-size: var(--font-base);
-}}
-
-.form-input:focus {{
-    outline: none;
-    border-color: var(--color-primary);
-    box-shadow: 0 0 0 3px rgba(59, 130, 246, 0.1);
-}}
-
-.form-error {{
-    color: var(--color-error);
-    font-size: var(--font-sm);
-    margin-top: var(--space-1);
-    display: none;
-}}
-
-.form-error:not(:empty) {{
-    display: block;
-}}
-
-.form-actions {{
-    display: flex;
-    gap: var(--space-3);
-    margin-top: var(--space-6);
-}}
-</style>
-''',
-        'go_handler': '''package handlers
-
-import (
-\t"encoding/json"
-\t"net/http"
-)
-
-type FormData struct {{
-\t{FieldName} string `json:"{field_name}"`
-}}
-
-type ValidationError struct {{
-\tField   string `json:"field"`
-\tMessage string `json:"message"`
-}}
-
-// {HandlerName} handles form submission with validation
-// HTMX endpoint: POST {api_endpoint}
-func (h *Handler) {HandlerName}(w http.ResponseWriter, r *http.Request) {{
-\t// Parse form data
-\terr := r.ParseForm()
-\tif err != nil {{
-\t\tw.WriteHeader(http.StatusBadRequest)
-\t\treturn
-\t}}
-
-\tformData := FormData{{
-\t\t{FieldName}: r.FormValue("{field_name}"),
-\t}}
-
-\t// Validate form data
-\tif errors := h.validateForm(formData); len(errors) > 0 {{
-\t\t// Return form with validation errors
-\t\th.renderFormWithErrors(w, formData, errors)
-\t\treturn
-\t}}
-
-\t// Process form data (implement your logic)
-\terr = h.formService.Submit(r.Context(), formData)
-\tif err != nil {{
-\t\tw.WriteHeader(http.StatusInternalServerError)
-\t\tw.Write([]byte("<p class='form-error korean-text'>{error_message}</p>"))
-\t\treturn
-\t}}
-
-\t// Return success message
-\tw.Header().Set("HX-Trigger", "formSubmitted")
-\tw.Write([]byte("<p class='text-success korean-text'>{success_message}</p>"))
-}}
-
-func (h *Handler) validateForm(data FormData) []ValidationError {{
-\terrors := []ValidationError{{}}
-\t
-\tif data.{FieldName} == "" {{
-\t\terrors = append(errors, ValidationError{{
-\t\t\tField:   "{field_name}",
-\t\t\tMessage: "{required_message}",
-\t\t}})
-\t}}
-\t
-\treturn errors
-}}
-''',
+        'html': 'form.html.j2',
+        'go_handler': 'form.go.j2',
+        'style': 'form.css',
         'params': {
             'form_id': 'data-form',
             'api_endpoint': '/api/form/submit',
@@ -550,130 +121,285 @@ func (h *Handler) validateForm(data FormData) []ValidationError {{
             'reset_text': '초기화',
             'loading_text': '저장 중...',
             'indicator_id': 'form-loading',
-            'error_message': '저장 중 오류가 발생했습니다',
-            'success_message': '저장되었습니다',
-            'required_message': '필수 입력 항목입니다',
+            'error_message': _MSG_SAVE_ERROR,
+            'success_message': _MSG_SAVE_SUCCESS,
+            'required_message': _MSG_REQUIRED,
         }
     },
 }
 
 # IME handling script for Korean input
-IME_SCRIPT = '''
-<script>
-// Korean IME (Input Method Editor) handling
-// Prevents premature AJAX requests during Hangul composition
-(function() {
-    const input = document.getElementById('{input_id}');
-    if (!input) return;
-
-    let isComposing = false;
-
-    input.addEventListener('compositionstart', () => {
-        isComposing = true;
-    });
-
-    input.addEventListener('compositionend', () => {
-        isComposing = false;
-        // Trigger HTMX after composition completes
-        htmx.trigger(input, 'keyup');
-    });
-
-    // Prevent triggering during composition
-    input.addEventListener('keyup', (e) => {
-        if (isComposing) {
-            e.stopImmediatePropagation();
-        }
-    });
-})();
-</script>
-'''
-
-def generate_component(component_type, name, korean=False, go_handler=False, output_dir=None):
-    """Generate HTMX component files"""
-
-    if component_type not in COMPONENTS:
-        print(f"Error: Unknown component type '{component_type}'")
-        print(f"Available types: {', '.join(COMPONENTS.keys())}")
+IME_TEMPLATE = 'ime_script.html.j2'
+
+def _compiled_templates_fresh():
+    """Whether the precompiled zip exists and is at least as new as every source"""
+    # A stale zip would shadow edited .j2 files, so it is only used while
+    # nothing under templates/ (at any depth) has changed since the build;
+    # the environment options (delimiters etc.) are baked into the compiled
+    # code, so the scripts count as sources too
+    try:
+        return COMPILED_TEMPLATES.stat().st_mtime_ns >= newest_mtime(__file__, TEMPLATE_DIR)
+    except OSError:
         return False
 
+@lru_cache(maxsize=None)
+def template_environment(use_cache=True, precompiled=True):
+    """Build the Jinja2 environment for the template files, or None without jinja2"""
+    try:
+        from jinja2 import ChoiceLoader, FileSystemLoader, ModuleLoader
+    except ImportError:
+        print("Error: Jinja2 not installed. Install with:")
+        print("  pip install Jinja2")
+        return None
+
+    # Modules from the precompiled zip skip parsing entirely; the template
+    # sources stay as a fallback for anything not in it
+    loader = FileSystemLoader(TEMPLATE_DIR)
+    if precompiled and _compiled_templates_fresh():
+        loader = ChoiceLoader([ModuleLoader(str(COMPILED_TEMPLATES)), loader])
+
+    return jinja_environment(loader, 'htmx_component_%s.cache' if use_cache else None)
+
+@lru_cache(maxsize=None)
+def _template(env, filename):
+    """Look up a compiled template once per run"""
+    return env.get_template(filename)
+
+def _render_template(env, filename, params):
+    """Call a compiled template's root render function directly on the parameters"""
+    # Same as Template.render, minus the extra copy of params into a fresh dict
+    template = _template(env, filename)
+    try:
+        return env.concat(template.root_render_func(template.new_context(params)))
+    except Exception:
+        return env.handle_exception()
+
+@lru_cache(maxsize=None)
+def _static_block(filename):
+    """Read a static stylesheet from the template directory once per run"""
+    return (TEMPLATE_DIR / filename).read_text(encoding='utf-8').rstrip('\n')
+
+@lru_cache(maxsize=128)
+def _ime_script(env, input_id):
+    """Render the IME script for an input; it only varies by input id"""
+    return _render_template(env, IME_TEMPLATE, {'input_id': input_id})
+
+# Separators that are not valid in a Go file name stem
+_GO_FILENAME_TRANS = str.maketrans('- .', '___')
+
+@lru_cache(maxsize=256)
+def _name_forms(name):
+    """Return the Go handler name and file stem for a component name"""
+    # Upper-case only the first letter so acronyms survive (url-API -> UrlAPI)
+    handler_name = ''.join(word[:1].upper() + word[1:] for word in name.split('-'))
+    return handler_name, name.translate(_GO_FILENAME_TRANS)
+
+@lru_cache(maxsize=None)
+def _output_dir(output_dir):
+    """Create an output directory once per run and return it as a normalized string"""
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    return os.fspath(output_path)
+
+def _write_stdout_bytes(data):
+    """Write already-encoded UTF-8 output straight to the stdout buffer"""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if buffer is None:
+        sys.stdout.write(data.decode('utf-8'))
+        return
+    # Text already printed is still in the wrapper; push it ahead of the bytes
+    sys.stdout.flush()
+    buffer.write(data)
+
+# Go template action that includes a component, written verbatim rather than
+# with doubled braces inside an f-string
+_GO_TEMPLATE_INCLUDE = '{{template "%s" .}}'
+
+@lru_cache(maxsize=64)
+def _render(env, component_type, name, korean, go_handler):
+    """Render a component, with a timestamp slot, for repeated identical requests
+
+    Returns (html_content, go_content, api_endpoint, handler_name, go_stem);
+    go_content is None when no Go handler was requested.
+    """
     component = COMPONENTS[component_type]
-    params = component['params'].copy()
-
-    # Add timestamp
-    params['timestamp'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Per-call values land in the front map; the shared defaults are never copied
+    params = ChainMap({'timestamp': TIMESTAMP_SLOT}, component['params'])
 
     # Add IME script if Korean
     if korean and 'input_id' in params:
-        params['ime_script'] = IME_SCRIPT.format(input_id=params['input_id'])
+        params['ime_script'] = _ime_script(env, params['input_id'])
     else:
         params['ime_script'] = ''
 
+    # Static stylesheets are substituted whole rather than run through the lexer
+    if 'style' in component:
+        params['style'] = _static_block(component['style'])
+
     # Update names
     if 'api_endpoint' in params:
         params['api_endpoint'] = params['api_endpoint'].replace('/api/', f'/api/{name}/')
 
     # Generate handler name
-    handler_name = ''.join(word.capitalize() for word in name.split('-'))
+    handler_name, go_stem = _name_forms(name)
     params['HandlerName'] = handler_name
 
     # Generate HTML
-    html_content = component['html'].format(**params)
-    html_filename = f"{name}.html"
+    html_content = _render_template(env, component['html'], params)
 
     # Generate Go handler if requested
     go_content = None
-    go_filename = None
     if go_handler and 'go_handler' in component:
-        go_content = component['go_handler'].format(**params)
-        go_filename = f"{name.replace('-', '_')}_handler.go"
+        go_content = _render_template(env, component['go_handler'], params)
+
+    return html_content, go_content, params.get('api_endpoint', '/api/...'), handler_name, go_stem
+
+def _build_component(component_type, name, korean=False, go_handler=False, output_dir=None,
+                     use_cache=True):
+    """Render and write one component; returns (success, text to print)"""
+
+    if component_type not in COMPONENTS:
+        return False, (f"Error: Unknown component type '{component_type}'\n"
+                       f"Available types: {', '.join(COMPONENTS.keys())}\n")
+
+    env = template_environment(use_cache)
+    if env is None:
+        return False, ''
+
+    html_content, go_content, api_endpoint, handler_name, go_stem = _render(
+        env, component_type, name, bool(korean), bool(go_handler))
+
+    # Add timestamp
+    from datetime import datetime
+    timestamp = datetime.now().strftime(TIMESTAMP_FORMAT)
+    html_content = html_content.replace(TIMESTAMP_SLOT, timestamp)
+    html_filename = f"{name}.html"
+
+    go_filename = None
+    if go_content:
+        go_content = go_content.replace(TIMESTAMP_SLOT, timestamp)
+        go_filename = f"{go_stem}_handler.go"
+
+    rule = '=' * 60
+    lines = []
 
     # Write files
     if output_dir:
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+        output_path = _output_dir(output_dir)
 
-        html_path = output_path / html_filename
-        with open(html_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        print(f"✅ Generated HTML: {html_path}")
+        html_path = os.path.join(output_path, html_filename)
+        with open(html_path, 'wb') as f:
+            f.write(html_content.encode('utf-8'))
+        lines.append(f"✅ Generated HTML: {html_path}")
 
         if go_content:
-            go_path = output_path / go_filename
-            with open(go_path, 'w', encoding='utf-8') as f:
-                f.write(go_content)
-            print(f"✅ Generated Go handler: {go_path}")
+            go_path = os.path.join(output_path, go_filename)
+            with open(go_path, 'wb') as f:
+                f.write(go_content.encode('utf-8'))
+            lines.append(f"✅ Generated Go handler: {go_path}")
     else:
         # Print to stdout
-        print(f"\n{'='*60}")
-        print(f"HTML Component: {html_filename}")
-        print(f"{'='*60}")
-        print(html_content)
-
+        lines += ['', rule, f"HTML Component: {html_filename}", rule, html_content]
         if go_content:
-            print(f"\n{'='*60}")
-            print(f"Go Handler: {go_filename}")
-            print(f"{'='*60}")
-            print(go_content)
+            lines += ['', rule, f"Go Handler: {go_filename}", rule, go_content]
 
     # Generate integration instructions
-    print(f"\n{'='*60}")
-    print("Integration Instructions")
-    print(f"{'='*60}")
-    print(f"1. Add HTML component to your template:")
-    print(f"   {{{{template \"{name}\" .}}}}")
-    print(f"\n2. Add Go handler to your router (cmd/web/main.go):")
-    print(f"   mux.Get(\"{params.get('api_endpoint', '/api/...')}\", handlers.{handler_name})")
-    print(f"\n3. Test the component visually:")
-    print(f"   python scripts/test_component.py --component {component_type} --output test-{name}.html")
-    print(f"{'='*60}\n")
-
-    return True
+    lines += [
+        '',
+        rule,
+        "Integration Instructions",
+        rule,
+        "1. Add HTML component to your template:",
+        "   " + _GO_TEMPLATE_INCLUDE % name,
+        '',
+        "2. Add Go handler to your router (cmd/web/main.go):",
+        f"   mux.Get(\"{api_endpoint}\", handlers.{handler_name})",
+        '',
+        "3. Test the component visually:",
+        f"   python scripts/test_component.py --component {component_type} --output test-{name}.html",
+        rule,
+        '',
+    ]
+    return True, '\n'.join(lines) + '\n'
+
+def generate_component(component_type, name, korean=False, go_handler=False, output_dir=None,
+                       use_cache=True):
+    """Generate HTMX component files"""
+    success, report = _build_component(component_type, name, korean, go_handler,
+                                       output_dir, use_cache)
+    # One write per component keeps its output together when several
+    # generators share a terminal or log
+    _write_stdout_bytes(report.encode('utf-8'))
+    return success
+
+# Below this many specs, process pool startup costs more than it saves
+PARALLEL_MIN_SPECS = 32
+
+def _build_spec(job):
+    """Build one --batch spec; module-level so process pool workers can run it"""
+    spec, output_dir, use_cache = job
+    return _build_component(**{'output_dir': output_dir, 'use_cache': use_cache, **spec})
+
+# Keys a --batch spec may set, with the type each value must have
+_SPEC_FIELDS = {'component_type': str, 'name': str, 'korean': bool, 'go_handler': bool,
+                'output_dir': str}
+
+def _spec_error(spec):
+    """Why a --batch spec cannot be generated, or None if it is valid"""
+    if not isinstance(spec, dict):
+        return 'expected an object with component_type and name'
+    unknown = sorted(set(spec) - _SPEC_FIELDS.keys())
+    if unknown:
+        return f"unknown keys: {', '.join(unknown)}"
+    for key in ('component_type', 'name'):
+        if key not in spec:
+            return f'missing {key}'
+    for key, value in spec.items():
+        if not isinstance(value, _SPEC_FIELDS[key]):
+            return f'{key} must be a {_SPEC_FIELDS[key].__name__}'
+    if spec['component_type'] not in COMPONENTS:
+        return (f"unknown component type '{spec['component_type']}' "
+                f"(available: {', '.join(COMPONENTS.keys())})")
+    if not spec['name']:
+        return 'name must not be empty'
+    return None
+
+def generate_batch(specs, output_dir=None, use_cache=True):
+    """Generate every component spec, across processes for large batches"""
+    # Check every spec up front so a bad one fails the run before anything
+    # is rendered, instead of as a traceback from a pool worker
+    if not isinstance(specs, list):
+        print("Error: --batch file must hold a JSON list of component specs", file=sys.stderr)
+        return False
+    errors = [f"Error: spec #{i}: {error}"
+              for i, error in enumerate(map(_spec_error, specs), 1) if error]
+    if errors:
+        print('\n'.join(errors), file=sys.stderr)
+        return False
 
-def main():
-    parser = argparse.ArgumentParser(
-        description='Generate HTMX components with optional Go handlers',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog=f'''
+    jobs = [(spec, output_dir, use_cache) for spec in specs]
+
+    if len(jobs) < PARALLEL_MIN_SPECS:
+        results = map(_build_spec, jobs)
+    else:
+        # Specs render and write independently; workers pick up the compiled
+        # templates from the bytecode cache or the precompiled zip
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(jobs) // (4 * (os.cpu_count() or 1)))
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(_build_spec, jobs, chunksize=chunksize))
+
+    # Reports are printed in spec order, whichever worker produced them
+    success = True
+    for ok, report in results:
+        _write_stdout_bytes(report.encode('utf-8'))
+        success = ok and success
+    return success
+
+def _epilog():
+    """Help text listing the component types and usage examples"""
+    return f'''
 Available component types:
   {chr(10).join(f"  {k:15} - {COMPONENTS[k]['params'].get('description', 'Component')}" for k in COMPONENTS.keys())}
 
@@ -689,12 +415,30 @@ Examples:
 
   # Complete component
   python generate_component.py --type search --name header-search --korean --go-handler --output /path/to/project/
+
+  # Many components in one run; components.json holds a list of objects such as
+  # {{"component_type": "search", "name": "header-search", "korean": true, "go_handler": true}}
+  python generate_component.py --batch components.json --output /path/to/project/
         '''
+
+def main():
+    # Imported here so importing the generator module stays cheap
+    import argparse
+    import json
+
+    from help_epilog import lazy_epilog
+
+    parser = argparse.ArgumentParser(
+        description='Generate HTMX components with optional Go handlers',
+        formatter_class=argparse.RawDescriptionHelpFormatter
     )
 
-    parser.add_argument('--type', required=True, choices=COMPONENTS.keys(),
+    # Only build the epilog when help is actually printed
+    lazy_epilog(parser, _epilog)
+
+    parser.add_argument('--type', choices=COMPONENTS.keys(),
                         help='Type of component to generate')
-    parser.add_argument('--name', required=True,
+    parser.add_argument('--name',
                         help='Name for the component (e.g., topic-search)')
     parser.add_argument('--korean', action='store_true',
                         help='Include Korean IME handling and localized messages')
@@ -702,15 +446,33 @@ Examples:
                         help='Generate matching Go handler code')
     parser.add_argument('--output', type=str,
                         help='Output directory (if not specified, prints to stdout)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Compile templates from scratch instead of using the bytecode cache')
+    parser.add_argument('--batch', type=Path,
+                        help='JSON file with a list of component specs to generate in one run')
 
     args = parser.parse_args()
 
+    if args.batch:
+        try:
+            specs = json.loads(args.batch.read_text(encoding='utf-8'))
+        except (OSError, UnicodeDecodeError, ValueError) as e:
+            # json.JSONDecodeError is a ValueError
+            print(f"Error: Could not read batch file {args.batch}: {e}", file=sys.stderr)
+            sys.exit(1)
+        success = generate_batch(specs, output_dir=args.output, use_cache=not args.no_cache)
+        sys.exit(0 if success else 1)
+
+    if not args.type or not args.name:
+        parser.error('--type and --name are required unless --batch is given')
+
     success = generate_component(
         component_type=args.type,
         name=args.name,
         korean=args.korean,
         go_handler=args.go_handler,
-        output_dir=args.output
+        output_dir=args.output,
+        use_cache=not args.no_cache
     )
 
     sys.exit(0 if success else 1)
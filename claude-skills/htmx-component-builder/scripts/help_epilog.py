@@ -0,0 +1,14 @@
+"""
+Argparse helper shared by the component builder scripts.
+"""
+
+
+def lazy_epilog(parser, build_epilog):
+    """Have parser call build_epilog() for its epilog only when help is formatted"""
+    format_help = parser.format_help
+
+    def format_help_with_epilog():
+        parser.epilog = build_epilog()
+        return format_help()
+
+    parser.format_help = format_help_with_epilog
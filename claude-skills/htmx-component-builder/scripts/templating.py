@@ -0,0 +1,41 @@
+"""
+Jinja2 and template helpers shared by the component builder scripts.
+"""
+
+import os
+
+# Rendered in place of the timestamp, so pages and components can be
+# rendered or prerendered once and stamped on every write
+TIMESTAMP_SLOT = '\x00timestamp\x00'
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def newest_mtime(script_file, source_dir):
+    """Modification time of the newest file under source_dir, script_file or this module"""
+    # Settings baked into prerendered output live in the scripts themselves
+    newest = max(os.stat(__file__).st_mtime_ns, os.stat(script_file).st_mtime_ns)
+    for root, _, files in os.walk(source_dir):
+        for name in files:
+            newest = max(newest, os.stat(os.path.join(root, name)).st_mtime_ns)
+    return newest
+
+
+def jinja_environment(loader, cache_pattern=None):
+    """Build a Jinja2 environment with the builder's delimiters; callers check jinja2 is installed"""
+    from jinja2 import Environment, FileSystemBytecodeCache, StrictUndefined
+
+    # Compiled templates persist in Jinja's per-user temp directory, so later
+    # runs skip lexing, parsing and code generation
+    bytecode_cache = None
+    if cache_pattern:
+        bytecode_cache = FileSystemBytecodeCache(pattern=cache_pattern)
+
+    # Every Jinja delimiter starts with '<' (<{ name }>, <% tag %>, <# note #>)
+    # so Go's {{ }} actions and CSS/JS braces pass through untouched
+    return Environment(loader=loader, bytecode_cache=bytecode_cache,
+                       variable_start_string='<{', variable_end_string='}>',
+                       block_start_string='<%', block_end_string='%>',
+                       comment_start_string='<#', comment_end_string='#>',
+                       trim_blocks=True, lstrip_blocks=True,
+                       keep_trailing_newline=True, auto_reload=False,
+                       undefined=StrictUndefined)
@@ -0,0 +1,53 @@
+let currentPage = 1;
+const MAX_PAGES = 5;
+
+document.body.addEventListener('htmx:configRequest', function(evt) {
+    if (!mockServerEnabled) return;
+
+    const url = evt.detail.path;
+    if (url.includes('/api/content')) {
+        evt.preventDefault();
+
+        const pageMatch = url.match(/page=(\d+)/);
+        const page = pageMatch ? parseInt(pageMatch[1]) : 1;
+
+        const html = cachedResponse(`/api/content?page=${page}`, () => {
+            let html = '';
+            if (page <= MAX_PAGES) {
+                for (let i = 0; i < 3; i++) {
+                    const itemNum = (page - 1) * 3 + i + 1;
+                    html += `
+                        <div class="content-item" style="padding: 1.5rem; background: white; border: 1px solid var(--border); border-radius: var(--radius-md); margin-bottom: 1rem;">
+                            <h3>콘텐츠 항목 ${itemNum}</h3>
+                            <p class="text-muted korean-text">페이지 ${page}의 콘텐츠입니다. 스크롤하면 더 많은 콘텐츠가 로드됩니다.</p>
+                        </div>
+                    `;
+                }
+
+                if (page < MAX_PAGES) {
+                    html += `
+                        <div hx-get="/api/content?page=${page + 1}"
+                             hx-trigger="revealed"
+                             hx-swap="afterend"
+                             hx-target="#content-list"
+                             hx-indicator="#scroll-loading">
+                        </div>
+                    `;
+                } else {
+                    html += '<div class="text-center text-muted korean-text" style="padding: 2rem;">모든 콘텐츠를 불러왔습니다</div>';
+                }
+            }
+            return html;
+        });
+
+        logNetworkRequest('GET', url, `Page: ${page}, Items: 3`);
+
+        setTimeout(() => {
+            const target = document.getElementById('content-list');
+            target.insertAdjacentHTML('beforeend', html);
+            document.body.dispatchEvent(new CustomEvent('htmx:afterSwap', {
+                detail: { target: target }
+            }));
+        }, 500);
+    }
+});
@@ -0,0 +1,43 @@
+document.body.addEventListener('htmx:configRequest', function(evt) {
+    if (!mockServerEnabled) return;
+
+    const url = evt.detail.path;
+    if (url.includes('/modal')) {
+        evt.preventDefault();
+
+        const html = `
+            <div class="modal-backdrop" onclick="this.parentElement.remove()" style="position: fixed; top: 0; left: 0; width: 100%; height: 100%; background: rgba(0,0,0,0.5); display: flex; align-items: center; justify-content: center;">
+                <div class="modal-dialog" onclick="event.stopPropagation()" style="background: white; border-radius: var(--radius-lg); max-width: 600px; width: 90%; max-height: 80vh; overflow-y: auto;">
+                    <div class="modal-header" style="display: flex; align-items: center; justify-content: space-between; padding: 1.5rem; border-bottom: 1px solid var(--border);">
+                        <h2 class="modal-title korean-text" style="margin: 0;">콘텐츠 상세보기</h2>
+                        <button onclick="this.closest('.modal-backdrop').remove()" style="background: none; border: none; font-size: 1.5rem; cursor: pointer;">✕</button>
+                    </div>
+                    <div class="modal-body korean-text" style="padding: 1.5rem;">
+                        <p>이것은 모달 콘텐츠입니다. HTMX를 사용하여 서버에서 동적으로 로드되었습니다.</p>
+                        <p style="margin-top: 1rem;">모달 외부를 클릭하거나 ESC 키를 누르면 닫힙니다.</p>
+                    </div>
+                    <div class="modal-footer" style="padding: 1.5rem; border-top: 1px solid var(--border); display: flex; justify-content: flex-end; gap: 0.75rem;">
+                        <button onclick="this.closest('.modal-backdrop').remove()" style="padding: 0.5rem 1rem; background: var(--color-bg-secondary); border: 1px solid var(--border); border-radius: var(--radius-md); cursor: pointer;">닫기</button>
+                    </div>
+                </div>
+            </div>
+        `;
+
+        logNetworkRequest('GET', url, 'Modal content loaded');
+
+        setTimeout(() => {
+            evt.detail.target.innerHTML = html;
+            document.body.dispatchEvent(new CustomEvent('htmx:afterSwap', {
+                detail: { target: evt.detail.target }
+            }));
+        }, 200);
+    }
+});
+
+// Close modal on ESC
+document.addEventListener('keydown', function(e) {
+    if (e.key === 'Escape') {
+        const modal = document.querySelector('.modal-backdrop');
+        if (modal) modal.remove();
+    }
+});
@@ -0,0 +1,61 @@
+// Mock search results
+const SAMPLE_CONTENT = [
+    { id: 1, title: 'HTMX를 사용한 동적 웹 애플리케이션 개발', type: 'Article' },
+    { id: 2, title: 'Go와 템플릿으로 서버 사이드 렌더링', type: 'Tutorial' },
+    { id: 3, title: 'Korean 텍스트 최적화 방법', type: 'Guide' },
+    { id: 4, title: '다크 모드 구현하기', type: 'Article' },
+    { id: 5, title: '무한 스크롤 패턴', type: 'Pattern' },
+];
+
+// Lowercase each title once instead of on every keystroke
+for (const item of SAMPLE_CONTENT) {
+    item.title_lc = item.title.toLowerCase();
+}
+
+document.body.addEventListener('htmx:configRequest', function(evt) {
+    if (!mockServerEnabled) return;
+
+    const url = evt.detail.path;
+    if (url.includes('/api/search')) {
+        evt.preventDefault();
+
+        const params = new URLSearchParams(evt.detail.parameters);
+        const query = params.get('q');
+        const { html, count } = cachedResponse(`${url}?${params}`, () => {
+            if (!query) {
+                return { html: '<p class="text-muted korean-text">검색어를 입력하세요</p>', count: 0 };
+            }
+
+            const query_lc = query.toLowerCase();
+            const results = SAMPLE_CONTENT.filter(item => item.title_lc.includes(query_lc));
+
+            if (results.length === 0) {
+                return {
+                    html: `<p class="text-muted korean-text">"${query}"에 대한 검색 결과가 없습니다</p>`,
+                    count: 0
+                };
+            }
+
+            let html = '<div style="display: flex; flex-direction: column; gap: 0.75rem;">';
+            results.forEach(item => {
+                html += `
+                    <div style="padding: 1rem; background: white; border: 1px solid var(--border); border-radius: var(--radius-md);">
+                        <h3 style="margin-bottom: 0.5rem; font-size: 1rem;">${item.title}</h3>
+                        <span style="font-size: 0.75rem; color: var(--foreground-muted);">${item.type}</span>
+                    </div>
+                `;
+            });
+            html += '</div>';
+            return { html, count: results.length };
+        });
+
+        logNetworkRequest('GET', url, `Query: ${query}, Results: ${count}`);
+
+        setTimeout(() => {
+            evt.detail.target.innerHTML = html;
+            document.body.dispatchEvent(new CustomEvent('htmx:afterSwap', {
+                detail: { target: evt.detail.target }
+            }));
+        }, 300);
+    }
+});
@@ -0,0 +1,63 @@
+let mockServerEnabled = true;
+let networkLog = [];
+
+function clearResults() {
+    const target = document.querySelector(RESULT_SELECTOR);
+    if (target) {
+        target.innerHTML = '';
+    }
+    networkLog = [];
+    document.getElementById('network-log').innerHTML = '';
+    console.log('Results cleared');
+}
+
+function toggleMockServer() {
+    mockServerEnabled = !mockServerEnabled;
+    const btn = document.getElementById('mock-toggle');
+    btn.textContent = mockServerEnabled ? 'Disable Mock Server' : 'Enable Mock Server';
+    console.log('Mock server', mockServerEnabled ? 'enabled' : 'disabled');
+}
+
+function showNetworkLog() {
+    const logDiv = document.getElementById('network-log');
+    logDiv.style.display = logDiv.style.display === 'none' ? 'block' : 'none';
+}
+
+// Mock responses by request URL and parameters. A real server renders
+// the same fragment for the same request, so repeats (typing a query
+// again, re-requesting a page) skip building the HTML. Real handlers
+// that answer HTMX and full-page requests differently should send
+// "Vary: HX-Request" so HTTP caches key on that header too; the mocks
+// only ever see HTMX requests, so the URL and parameters are enough
+const mockResponseCache = new Map();
+
+function cachedResponse(key, render) {
+    if (!mockResponseCache.has(key)) {
+        mockResponseCache.set(key, render());
+    }
+    return mockResponseCache.get(key);
+}
+
+function logNetworkRequest(method, url, response) {
+    const timestamp = new Date().toISOString();
+    const logEntry = `[${timestamp}] ${method} ${url}\n${response}\n`;
+    networkLog.push(logEntry);
+
+    const logDiv = document.getElementById('network-log');
+    logDiv.innerHTML += `<div style="margin-bottom: 1rem; padding-bottom: 1rem; border-bottom: 1px solid #333;">${logEntry}</div>`;
+    logDiv.scrollTop = logDiv.scrollHeight;
+}
+
+// Listen to HTMX events
+document.body.addEventListener('htmx:beforeRequest', function(evt) {
+    console.log('HTMX Request:', evt.detail);
+});
+
+document.body.addEventListener('htmx:afterSwap', function(evt) {
+    console.log('HTMX Response:', evt.detail);
+});
+
+document.body.addEventListener('htmx:responseError', function(evt) {
+    console.error('HTMX Error:', evt.detail);
+    alert('Request failed. Check console for details.');
+});
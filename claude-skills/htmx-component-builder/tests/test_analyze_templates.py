@@ -0,0 +1,50 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import analyze_templates  # noqa: E402
+
+# '{% for' ends the first line, so the loop token's \s is the newline itself
+TEMPLATE = '<ul>{% for\n item in items %}<li>{{ item }}</li>{% endfor %}</ul>\n'
+
+
+def _found(scan, path):
+    opportunities = []
+    scan(str(path), opportunities)
+    return [(o.line_num, o.opp_type) for o in opportunities]
+
+
+@pytest.mark.parametrize('numba', [False, True])
+def test_mapped_scan_matches_loop_at_line_end(tmp_path, monkeypatch, numba):
+    if numba:
+        pytest.importorskip('numba')
+    else:
+        monkeypatch.setattr(analyze_templates, '_numba_prefilter', lambda: None)
+    path = tmp_path / 'list.html'
+    path.write_text(TEMPLATE, encoding='utf-8')
+
+    assert _found(analyze_templates._scan_mapped, path) == [(1, 'Content List')]
+    assert _found(analyze_templates._scan_mapped, path) == _found(analyze_templates._scan_lines, path)
+
+
+# A lone '\r' does not end a line; the modal sits on line 2 for every scan path
+CR_TEMPLATE = '<p>a\rb</p>\n<div class="modal">\r\n</div>\n'
+
+
+@pytest.mark.parametrize('numba', [False, True])
+def test_lone_carriage_return_keeps_line_numbers_consistent(tmp_path, monkeypatch, numba):
+    if numba:
+        pytest.importorskip('numba')
+    else:
+        monkeypatch.setattr(analyze_templates, '_numba_prefilter', lambda: None)
+    path = tmp_path / 'cr.html'
+    path.write_bytes(CR_TEMPLATE.encode('utf-8'))
+
+    opportunities = []
+    analyze_templates._scan_lines(str(path), opportunities)
+    assert [(o.line_num, o.opp_type) for o in opportunities] == [(2, 'Modal Trigger')]
+    assert opportunities[0].element == '<div class="modal">'
+    assert _found(analyze_templates._scan_mapped, path) == [(2, 'Modal Trigger')]